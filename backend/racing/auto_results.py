@@ -10,6 +10,7 @@ Features:
 """
 
 import asyncio
+import functools
 import threading
 import time
 import re
@@ -18,12 +19,93 @@ from typing import List, Dict, Optional
 
 # Try importing playwright (may not be installed)
 try:
-    from playwright.async_api import async_playwright
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     print("⚠️ Playwright not installed - auto-fetch will use mock data")
 
+RESULTS_URL = 'https://www.ladbrokes.com.au/racing/results'
+DETAIL_CONCURRENCY = 3  # Race pages open at once per meeting
+BROWSER_RECYCLE_EVERY = 10  # Meetings per Chromium process before relaunch
+MAX_SCROLLS = 8  # Upper bound on lazy-load scrolls of the results page
+
+# Lines that end a meeting's block / a race's RESULTS section
+_REGION_LINES = frozenset({'VIC', 'NSW', 'QLD', 'SA', 'WA', 'TAS', 'NT', 'NZ', 'HK'})
+_RESULTS_END_LINES = frozenset({'EXOTIC RESULTS', 'FINAL MARGINS'})
+
+# Patterns used in the per-line parse loops
+_RACE_RE = re.compile(r'^R(\d+)$')
+_RESULT_CELL_RE = re.compile(r'^\d+[/\d]*,\s*\d+')  # "1, 2, 3" or "1/2, 3, 4"
+_J_RE = re.compile(r'^J(?:\s+|:\s*)[A-Z]')  # "J Name" or "J: Name"
+_JSTRIP_RE = re.compile(r'^J[:\s]+')
+_PAREN_RE = re.compile(r'\s*\([^)]+\)$')  # Trailing (a3) etc
+_NONALPHA_RE = re.compile(r'[^a-z]')
+
+# Read the top 3 result rows straight from the race page DOM
+_RESULT_ROWS_JS = r'''() => {
+    const rows = document.querySelectorAll('[data-testid="result-row"], .result-row, li.result');
+    const out = [];
+    for (const el of rows) {
+        const j = el.querySelector('.jockey, [data-testid="jockey"]');
+        const name = (j ? j.innerText : '').replace(/^J[:\s]+/, '').replace(/\s*\([^)]+\)\s*$/, '').trim();
+        if (name && !out.some(r => r.jockey === name)) {
+            out.push({position: out.length + 1, jockey: name});
+        }
+        if (out.length >= 3) break;
+    }
+    return out;
+}'''
+
+
+class BrowserPool:
+    """
+    Holds one Chromium instance and relaunches it every `recycle_every`
+    uses, so a long-running fetcher doesn't accumulate leaked memory
+    """
+    
+    def __init__(self, recycle_every: int = BROWSER_RECYCLE_EVERY):
+        self.recycle_every = recycle_every
+        self.playwright = None
+        self.browser = None
+        self.count = 0
+    
+    async def get(self):
+        """Browser for the next meeting (relaunched when due or disconnected)"""
+        if (self.browser is None or self.count >= self.recycle_every
+                or not self.browser.is_connected()):
+            await self.discard()
+            if self.playwright is None:
+                self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(
+                headless=True,
+                args=['--no-sandbox', '--disable-dev-shm-usage']
+            )
+            self.count = 0
+        self.count += 1
+        return self.browser
+    
+    async def discard(self):
+        """Drop the current browser so the next get() launches a fresh one"""
+        if self.browser:
+            try:
+                await self.browser.close()
+            except Exception:
+                pass  # Already crashed/disconnected - just relaunch
+        self.browser = None
+        self.count = 0
+    
+    async def close(self):
+        try:
+            if self.browser:
+                await self.browser.close()
+            if self.playwright:
+                await self.playwright.stop()
+        finally:
+            self.browser = None
+            self.playwright = None
+            self.count = 0
+
 
 class AutoResultsFetcher:
     """
@@ -33,23 +115,33 @@ class AutoResultsFetcher:
     def __init__(self):
         self.timeout = 30000
         self.is_running = False
+        self.pool = BrowserPool()
     
     async def get_browser(self):
-        """Initialize browser"""
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
-        context = await browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            locale='en-AU',
-            timezone_id='Australia/Sydney'
-        )
-        return playwright, browser, context
+        """Shared browser, recycled periodically by the pool"""
+        return await self.pool.get()
+    
+    async def new_context(self):
+        """Fresh isolated context on the shared browser"""
+        browser = await self.get_browser()
+        try:
+            return await browser.new_context(
+                viewport={'width': 1920, 'height': 1080},
+                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+                locale='en-AU',
+                timezone_id='Australia/Sydney'
+            )
+        except Exception:
+            # Browser is unusable - start fresh on the next fetch
+            await self.pool.discard()
+            raise
     
-    async def fetch_results(self, meeting_name: str, last_race_fetched: int = 0) -> Dict:
+    async def close(self):
+        """Shut down the shared browser"""
+        await self.pool.close()
+    
+    async def fetch_results(self, meeting_name: str, last_race_fetched: int = 0,
+                            total_races: int = 8) -> Dict:
         """
         Fetch results for races after last_race_fetched
         
@@ -75,32 +167,22 @@ class AutoResultsFetcher:
             'error': None
         }
         
-        playwright = browser = context = None
+        context = None
         
         try:
-            playwright, browser, context = await self.get_browser()
+            context = await self.new_context()
             page = await context.new_page()
             
             print(f"[AutoFetch] Checking {meeting_name} for new results...")
             
             # Go to results page
-            await page.goto('https://www.ladbrokes.com.au/racing/results', timeout=60000)
-            await asyncio.sleep(3)
-            
-            # Scroll to load content
-            for _ in range(5):
-                await page.evaluate('window.scrollBy(0, 300)')
-                await asyncio.sleep(0.2)
+            await self._load_results_page(page, timeout=60000)
             
             text = await page.evaluate('document.body.innerText')
             lines = [l.strip() for l in text.split('\n') if l.strip()]
             
             # Find meeting in results
-            meeting_idx = None
-            for i, line in enumerate(lines):
-                if line.lower() == meeting_name.lower():
-                    meeting_idx = i
-                    break
+            meeting_idx = find_meeting_in_lines(lines, meeting_name)
             
             if meeting_idx is None:
                 result['error'] = f'Meeting {meeting_name} not found in results'
@@ -112,30 +194,48 @@ class AutoResultsFetcher:
             while i < min(meeting_idx + 30, len(lines)):
                 line = lines[i]
                 # Stop if we hit another state/region
-                if line in ['VIC', 'NSW', 'QLD', 'SA', 'WA', 'TAS', 'NT', 'NZ', 'HK'] and i > meeting_idx + 3:
+                if line in _REGION_LINES and i > meeting_idx + 3:
                     break
                 
-                m = re.match(r'^R(\d+)$', line)
+                m = _RACE_RE.match(line)
                 if m and i + 1 < len(lines):
                     race_num = int(m.group(1))
                     result_cell = lines[i + 1]
                     # Check if race has results (format: "1, 2, 3" or "1/2, 3, 4")
-                    if re.match(r'^\d+[/\d]*,\s*\d+', result_cell):
+                    if _RESULT_CELL_RE.match(result_cell):
                         if race_num > last_race_fetched:
                             completed_races.append((race_num, result_cell))
+                            # Every outstanding race found - no need to read further
+                            if 0 < total_races - last_race_fetched <= len(completed_races):
+                                break
                 i += 1
             
             print(f"[AutoFetch] Found {len(completed_races)} new completed races")
             
-            # Fetch details for each new race
+            # Resolve each race link from the already-loaded page, then open
+            # the race pages concurrently instead of re-navigating per race
+            semaphore = asyncio.Semaphore(DETAIL_CONCURRENCY)
+            race_nums, tasks = [], []
             for race_num, result_cell in completed_races:
                 try:
-                    race_result = await self._fetch_race_details(page, meeting_name, race_num, result_cell)
-                    if race_result:
-                        result['new_races'].append(race_result)
-                        result['last_race'] = max(result['last_race'], race_num)
-                except Exception as e:
-                    print(f"[AutoFetch] Error fetching R{race_num}: {e}")
+                    handle = await page.query_selector(f'text="{result_cell}"')
+                except Exception:
+                    handle = None
+                if handle is None:
+                    # Nothing to open or click - don't spend a page load on it
+                    print(f"[AutoFetch] R{race_num}: result cell not on page, skipping")
+                    continue
+                href = await self._result_cell_href(handle)
+                race_nums.append(race_num)
+                tasks.append(self._fetch_race_details(context, semaphore, race_num, result_cell, href))
+            
+            race_results = await asyncio.gather(*tasks, return_exceptions=True)
+            for race_num, race_result in zip(race_nums, race_results):
+                if isinstance(race_result, Exception):
+                    print(f"[AutoFetch] Error fetching R{race_num}: {race_result}")
+                elif race_result:
+                    result['new_races'].append(race_result)
+                    result['last_race'] = max(result['last_race'], race_num)
             
             result['success'] = True
             print(f"[AutoFetch] Done - {len(result['new_races'])} new races fetched")
@@ -145,67 +245,68 @@ class AutoResultsFetcher:
             print(f"[AutoFetch] Error: {e}")
         
         finally:
-            if browser:
-                await browser.close()
-            if playwright:
-                await playwright.stop()
+            if context:
+                await context.close()
         
         return result
     
-    async def _fetch_race_details(self, page, meeting_name: str, race_num: int, result_cell: str) -> Optional[Dict]:
-        """Fetch detailed results for a single race"""
+    async def _load_results_page(self, page, timeout: int = 30000):
+        """Open the results page and wait for race rows rather than sleeping"""
+        await page.goto(RESULTS_URL, timeout=timeout, wait_until='domcontentloaded')
         try:
-            # Navigate back to results
-            await page.goto('https://www.ladbrokes.com.au/racing/results', timeout=30000)
-            await asyncio.sleep(2)
-            
-            # Scroll
-            for _ in range(5):
-                await page.evaluate('window.scrollBy(0, 300)')
-                await asyncio.sleep(0.2)
-            
-            # Click on the result cell
-            await page.click(f'text="{result_cell}"', timeout=5000)
-            await asyncio.sleep(3)
-            
-            # Get page content
-            text = await page.evaluate('document.body.innerText')
-            lines = [l.strip() for l in text.split('\n') if l.strip()]
-            
-            # Extract jockeys from RESULTS section
-            results = []
-            in_results = False
-            
-            for line in lines:
-                if line == 'RESULTS':
-                    in_results = True
-                    continue
-                if in_results and line in ['EXOTIC RESULTS', 'FINAL MARGINS']:
-                    break
+            await page.wait_for_selector('text=/^R\\d+$/', timeout=8000)
+        except PlaywrightTimeout:
+            pass
+        
+        # Scroll only while lazy-loading keeps growing the page
+        last_height = 0
+        for _ in range(MAX_SCROLLS):
+            height = await page.evaluate('document.body.scrollHeight')
+            if height <= last_height:
+                break
+            last_height = height
+            await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+            await asyncio.sleep(0.2)
+    
+    async def _result_cell_href(self, handle) -> Optional[str]:
+        """Get the race link behind a result cell on the loaded results page"""
+        try:
+            return await handle.evaluate('e => { const a = e.closest("a"); return a ? a.href : null; }')
+        except Exception:
+            return None
+    
+    async def _fetch_race_details(self, context, semaphore, race_num: int, result_cell: str,
+                                  href: Optional[str] = None) -> Optional[Dict]:
+        """Fetch detailed results for a single race in its own page"""
+        async with semaphore:
+            page = await context.new_page()
+            try:
+                if href:
+                    await page.goto(href, timeout=15000, wait_until='domcontentloaded')
+                else:
+                    # No link found - fall back to clicking the cell on the results page
+                    await self._load_results_page(page)
+                    await page.click(f'text="{result_cell}"', timeout=5000)
+                await asyncio.sleep(3)
                 
-                # Match jockey line: "J Name" or "J: Name"
-                if in_results and (re.match(r'^J\s+[A-Z]', line) or re.match(r'^J:\s*[A-Z]', line)):
-                    jockey = re.sub(r'^J[:\s]+', '', line).strip()
-                    jockey = re.sub(r'\s*\([^)]+\)$', '', jockey)  # Remove (a3) etc
-                    
-                    if jockey and jockey not in [r['jockey'] for r in results]:
-                        results.append({
-                            'position': len(results) + 1,
-                            'jockey': jockey
-                        })
-                    
-                    if len(results) >= 3:
-                        break
-            
-            if results:
-                print(f"[AutoFetch] R{race_num}: {[r['jockey'] for r in results]}")
-                return {
-                    'race': race_num,
-                    'results': results
-                }
+                # Structured rows first; fall back to parsing the page text
+                results = await page.evaluate(_RESULT_ROWS_JS)
+                if not results:
+                    text = await page.evaluate('document.body.innerText')
+                    lines = [l.strip() for l in text.split('\n') if l.strip()]
+                    results = extract_jockey_results(lines)
+                if results:
+                    print(f"[AutoFetch] R{race_num}: {[r['jockey'] for r in results]}")
+                    return {
+                        'race': race_num,
+                        'results': results
+                    }
+                
+            except Exception as e:
+                print(f"[AutoFetch] R{race_num} error: {str(e)[:50]}")
             
-        except Exception as e:
-            print(f"[AutoFetch] R{race_num} error: {str(e)[:50]}")
+            finally:
+                await page.close()
         
         return None
     
@@ -221,9 +322,60 @@ class AutoResultsFetcher:
         }
 
 
+def find_meeting_in_lines(lines: List[str], meeting_name: str) -> Optional[int]:
+    """
+    Index of the meeting heading on the results page, or None.
+    
+    One pass: an exact (case-insensitive) match wins immediately, otherwise
+    the first line that matches ignoring punctuation/spacing is used.
+    """
+    target = meeting_name.strip().lower()
+    target_norm = _NONALPHA_RE.sub('', target)
+    loose_idx = None
+    for i, line in enumerate(lines):
+        lower = line.lower()
+        if lower == target:
+            return i
+        if loose_idx is None and target_norm and _NONALPHA_RE.sub('', lower) == target_norm:
+            loose_idx = i
+    return loose_idx
+
+
+def extract_jockey_results(lines: List[str]) -> List[Dict]:
+    """Extract the placed jockeys from the RESULTS section of a race page"""
+    results = []
+    seen = set()
+    in_results = False
+    
+    for line in lines:
+        if line == 'RESULTS':
+            in_results = True
+            continue
+        if in_results and line in _RESULTS_END_LINES:
+            break
+        
+        # Match jockey line: "J Name" or "J: Name"
+        if in_results and _J_RE.match(line):
+            jockey = _JSTRIP_RE.sub('', line).strip()
+            jockey = _PAREN_RE.sub('', jockey)  # Remove (a3) etc
+            
+            if jockey and jockey not in seen:
+                seen.add(jockey)
+                results.append({
+                    'position': len(results) + 1,
+                    'jockey': jockey
+                })
+        
+        if len(results) >= 3:
+            break
+    
+    return results
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_name(name: str) -> str:
     """Normalize jockey/driver name for matching"""
-    name = re.sub(r'\s*\([^)]+\)$', '', name).strip()
+    name = _PAREN_RE.sub('', name).strip()
     return ' '.join(name.split()).lower()
 
 
@@ -251,33 +403,40 @@ def match_jockey(result_name: str, challenge_jockeys: List[str]) -> Optional[str
     return None
 
 
-def fetch_and_update_meeting(meeting_name: str, jockeys_list: List[str], last_race_fetched: int = 0) -> Dict:
+def fetch_and_update_meeting(meeting_name: str, jockeys_list: List[str], last_race_fetched: int = 0,
+                             fetcher: Optional[AutoResultsFetcher] = None, total_races: int = 8) -> Dict:
     """
     Fetch results and update database
     
-    This is the main function to call from views
+    This is the main function to call from views. Pass a long-lived
+    fetcher (and keep the same event loop) to reuse its browser.
     """
     from .models import PointsLedger, LiveTrackerState, AutoFetchConfig
     from django.utils import timezone
     
     # Run async fetch
-    fetcher = AutoResultsFetcher()
+    owns_fetcher = fetcher is None
+    if owns_fetcher:
+        fetcher = AutoResultsFetcher()
+    
+    async def _fetch():
+        try:
+            return await fetcher.fetch_results(meeting_name, last_race_fetched, total_races)
+        finally:
+            if owns_fetcher:
+                await fetcher.close()
 
     try:
         # Use existing event loop if available, otherwise create a new one
         loop = asyncio.get_event_loop()
         if loop.is_closed():
             raise RuntimeError("Loop is closed")
-        fetch_result = loop.run_until_complete(
-            fetcher.fetch_results(meeting_name, last_race_fetched)
-        )
+        fetch_result = loop.run_until_complete(_fetch())
     except RuntimeError:
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         try:
-            fetch_result = loop.run_until_complete(
-                fetcher.fetch_results(meeting_name, last_race_fetched)
-            )
+            fetch_result = loop.run_until_complete(_fetch())
         finally:
             loop.close()
     
@@ -445,42 +604,54 @@ class AutoFetchRunner:
         from django.utils import timezone
         from datetime import timedelta
         
-        while self.is_running:
-            try:
-                # Get all enabled configs
-                configs = AutoFetchConfig.objects.filter(is_enabled=True)
-                
-                for config in configs:
-                    # Check if due for fetch
-                    if config.last_fetch_at:
-                        next_fetch = config.last_fetch_at + timedelta(seconds=config.fetch_interval_seconds)
-                        if timezone.now() < next_fetch:
-                            continue
-                    
-                    # Skip if meeting complete
-                    if config.last_race_fetched >= config.total_races:
-                        continue
-                    
-                    print(f"[AutoFetchRunner] Fetching {config.meeting_name}...")
+        # One event loop and browser for the lifetime of this thread;
+        # each meeting gets its own context
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        fetcher = AutoResultsFetcher()
+        
+        try:
+            while self.is_running:
+                try:
+                    # Get all enabled configs
+                    configs = AutoFetchConfig.objects.filter(is_enabled=True)
                     
-                    try:
-                        result = fetch_and_update_meeting(
-                            config.meeting_name,
-                            config.get_jockeys_list(),
-                            config.last_race_fetched
-                        )
+                    for config in configs:
+                        # Check if due for fetch
+                        if config.last_fetch_at:
+                            next_fetch = config.last_fetch_at + timedelta(seconds=config.fetch_interval_seconds)
+                            if timezone.now() < next_fetch:
+                                continue
                         
-                        if result.get('success'):
-                            print(f"[AutoFetchRunner] ✅ {config.meeting_name}: {result.get('new_races', 0)} new races")
+                        # Skip if meeting complete
+                        if config.last_race_fetched >= config.total_races:
+                            continue
                         
-                    except Exception as e:
-                        print(f"[AutoFetchRunner] ❌ {config.meeting_name}: {e}")
+                        print(f"[AutoFetchRunner] Fetching {config.meeting_name}...")
+                        
+                        try:
+                            result = fetch_and_update_meeting(
+                                config.meeting_name,
+                                config.get_jockeys_list(),
+                                config.last_race_fetched,
+                                fetcher=fetcher,
+                                total_races=config.total_races
+                            )
+                            
+                            if result.get('success'):
+                                print(f"[AutoFetchRunner] ✅ {config.meeting_name}: {result.get('new_races', 0)} new races")
+                            
+                        except Exception as e:
+                            print(f"[AutoFetchRunner] ❌ {config.meeting_name}: {e}")
+                    
+                except Exception as e:
+                    print(f"[AutoFetchRunner] Loop error: {e}")
                 
-            except Exception as e:
-                print(f"[AutoFetchRunner] Loop error: {e}")
-            
-            # Wait before next check
-            time.sleep(self.check_interval)
+                # Wait before next check
+                time.sleep(self.check_interval)
+        finally:
+            loop.run_until_complete(fetcher.close())
+            loop.close()
 
 
 # Global runner instance
@@ -3,6 +3,15 @@ import re
 from datetime import datetime
 from playwright.async_api import async_playwright
 
+# Lines that end a meeting's block on the results page
+_REGION_LINES = frozenset({'VIC', 'NSW', 'QLD', 'SA', 'WA', 'TAS', 'NT', 'NZ', 'HK'})
+
+# Patterns used in the per-line parse loops
+_RACE_RE = re.compile(r'^R(\d+)$')
+_RESULT_CELL_RE = re.compile(r'^\d+[/\d]*,\s*\d+,\s*\d+')
+_POSITION_RE = re.compile(r'^(\d+)\.$')
+_JOCKEY_RE = re.compile(r'^J:\s*(.+?)(?:\s*\([^)]+\))?$')
+
 class ResultsScraper:
     
     async def get_browser(self):
@@ -46,11 +55,11 @@ class ResultsScraper:
             # Get completed races
             completed = []
             for i in range(meeting_idx + 2, min(meeting_idx + 20, len(lines))):
-                if lines[i] in ['VIC','NSW','QLD','SA','WA','TAS','NT','NZ','HK'] and i > meeting_idx + 2:
+                if lines[i] in _REGION_LINES and i > meeting_idx + 2:
                     break
-                m = re.match(r'^R(\d+)$', lines[i])
+                m = _RACE_RE.match(lines[i])
                 if m and i+1 < len(lines):
-                    if re.match(r'^\d+[/\d]*,\s*\d+,\s*\d+', lines[i+1]) or lines[i+1] == 'Final':
+                    if _RESULT_CELL_RE.match(lines[i+1]) or lines[i+1] == 'Final':
                         completed.append(int(m.group(1)))
             
             print(f"[Results] Completed races: {completed}")
@@ -70,19 +79,20 @@ class ResultsScraper:
                     
                     results = []
                     for idx, ln in enumerate(lns):
-                        pm = re.match(r'^(\d+)\.$', ln)
+                        pm = _POSITION_RE.match(ln)
                         if pm:
                             pos = int(pm.group(1))
                             for k in range(idx+1, min(idx+12, len(lns))):
-                                jm = re.match(r'^J:\s*(.+?)(?:\s*\([^)]+\))?$', lns[k])
+                                jm = _JOCKEY_RE.match(lns[k])
                                 if jm:
                                     results.append({'position': pos, 'jockey': jm.group(1).strip()})
                                     break
                     
                     results.sort(key=lambda x: x['position'])
                     if results:
-                        meeting_results['races'].append({'race': rnum, 'results': results[:3]})
-                        print(f"[Results] R{rnum}: {[r['jockey'] for r in results[:3]]}")
+                        top3 = results[:3]
+                        meeting_results['races'].append({'race': rnum, 'results': top3})
+                        print(f"[Results] R{rnum}: {[r['jockey'] for r in top3]}")
                 except Exception as e:
                     print(f"[Results] R{rnum} err: {str(e)[:30]}")
             
@@ -29,6 +29,7 @@ urlpatterns = [
     path('live-tracker/', views.get_all_live_trackers, name='live_trackers'),
     path('live-tracker/init/', views.init_live_tracker, name='init_live_tracker'),
     path('live-tracker/update/', views.update_race_result, name='update_race_result'),
+    path('live-tracker/bulk-update/', views.bulk_update_race_results, name='bulk_update_race_results'),
     path('live-tracker/margin/', views.update_tracker_margin, name='update_margin'),
     path('live-tracker/auto-update/', views.auto_update_tracker, name='auto_update'),
     path('live-tracker/<str:meeting_name>/', views.get_live_tracker, name='live_tracker'),
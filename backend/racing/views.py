@@ -841,6 +841,185 @@ def init_live_tracker(request):
         return JsonResponse({'success': False, 'error': str(e)}, status=500)
 
 
+def _apply_race_result(meeting, race_num, results, actual_total_races=None):
+    """Apply one race result to a tracker. Returns (response data, status)."""
+    if not meeting or not race_num:
+        return {'success': False, 'error': 'meeting and race_num required'}, 400
+
+    with transaction.atomic():
+        try:
+            tracker = LiveTrackerState.objects.select_for_update().get(meeting_name=meeting)
+        except LiveTrackerState.DoesNotExist:
+            return {'success': False, 'error': 'Meeting not found'}, 404
+
+        # Update total_races if actual count provided and different
+        total_changed = bool(actual_total_races and actual_total_races != tracker.total_races)
+        if total_changed:
+            print(f"[Tracker] Updating {meeting} total_races: {tracker.total_races} -> {actual_total_races}")
+            tracker.total_races = actual_total_races
+            # Also update rides_remaining for all participants
+            participants = tracker.get_participants()
+            for name, pdata in participants.items():
+                races_done = len(pdata.get('positions', []))
+                pdata['rides_total'] = actual_total_races
+                pdata['rides_remaining'] = max(0, actual_total_races - races_done)
+            tracker.set_participants(participants)
+
+        if race_num <= tracker.races_completed:
+            # Check if stored results differ (correction needed)
+            stored_results = tracker.get_race_results()
+            stored_race = None
+            for sr in stored_results:
+                if sr.get('race') == race_num:
+                    stored_race = sr
+                    break
+
+            needs_correction = False
+            if stored_race:
+                old_names = {r.get('jockey', r.get('name', '')).lower() for r in stored_race.get('results', [])}
+                new_names = {r.get('jockey', r.get('name', '')).lower() for r in results}
+                if old_names != new_names:
+                    needs_correction = True
+                    print(f"[Tracker] CORRECTION for {meeting} R{race_num}: {old_names} -> {new_names}")
+
+            if not needs_correction:
+                if total_changed:
+                    tracker.save()
+                return {'success': True, 'message': 'Race already processed'}, 200
+
+            # Reset meeting to reprocess all races from scratch
+            print(f"[Tracker] Resetting {meeting} for correction...")
+            participants = tracker.get_participants()
+            for name, pdata in participants.items():
+                pdata['current_points'] = 0
+                pdata['positions'] = []
+                pdata['points_history'] = []
+                pdata['rides_remaining'] = tracker.total_races
+            tracker.set_participants(participants)
+            tracker.races_completed = 0
+            tracker.race_results_data = '[]'
+            tracker.save()
+
+            # Return requesting all results be re-sent
+            return {
+                'success': True,
+                'message': 'Correction detected - meeting reset',
+                'reset': True
+            }, 200
+
+        participants = tracker.get_participants()
+
+        # Points system
+        points_map = {1: 3, 2: 2, 3: 1}
+
+        # Count positions for dead heat detection
+        position_counts = {}
+        for r in results:
+            pos = r.get('position', 0)
+            if pos in [1, 2, 3]:
+                position_counts[pos] = position_counts.get(pos, 0) + 1
+
+        # Track who got points
+        participants_in_race = set()
+
+        for r in results:
+            jockey = r.get('jockey', r.get('driver', r.get('name', '')))
+            position = r.get('position', 0)
+
+            # Find matching participant (case-insensitive)
+            matched_name = None
+            for pname in participants.keys():
+                if pname.lower() == jockey.lower() or jockey.lower() in pname.lower() or pname.lower() in jockey.lower():
+                    matched_name = pname
+                    break
+
+            if matched_name and position in [1, 2, 3]:
+                participants_in_race.add(matched_name)
+
+                # Calculate points with dead heat
+                num_at_position = position_counts.get(position, 1)
+
+                if num_at_position > 1:
+                    positions_consumed = list(range(position, min(position + num_at_position, 4)))
+                    total_points = sum(points_map.get(p, 0) for p in positions_consumed)
+                    points = round(total_points / num_at_position, 1)
+                else:
+                    points = points_map.get(position, 0)
+
+                participants[matched_name]['current_points'] += points
+                participants[matched_name]['positions'].append(position)
+                participants[matched_name]['points_history'].append(points)
+                participants[matched_name]['rides_remaining'] -= 1
+
+        # Mark non-placed participants
+        for name, pdata in participants.items():
+            if name not in participants_in_race and pdata['rides_remaining'] > 0:
+                pdata['rides_remaining'] -= 1
+                pdata['positions'].append(0)
+                pdata['points_history'].append(0)
+
+        # Recalculate AI prices
+        participants = _recalculate_ai_prices(participants, race_num, tracker.margin)
+
+        # Save race result
+        race_result = {
+            'race': race_num,
+            'results': results,
+            'dead_heats': {pos: count for pos, count in position_counts.items() if count > 1},
+            'timestamp': timezone.now().isoformat()
+        }
+
+        # Update tracker in DATABASE
+        tracker.set_participants(participants)
+        tracker.races_completed = race_num
+        tracker.add_race_result(race_result)
+        tracker.save()
+
+        # Also save to PointsLedger for history
+        today = date.today()
+        for r in results:
+            jockey = r.get('jockey', r.get('driver', r.get('name', '')))
+            position = r.get('position', 0)
+
+            if position in [1, 2, 3]:
+                num_at_position = position_counts.get(position, 1)
+                is_dead_heat = num_at_position > 1
+
+                if is_dead_heat:
+                    positions_consumed = list(range(position, min(position + num_at_position, 4)))
+                    total_points = sum(points_map.get(p, 0) for p in positions_consumed)
+                    points = round(total_points / num_at_position, 1)
+                else:
+                    points = points_map.get(position, 0)
+
+                PointsLedger.objects.update_or_create(
+                    meeting_name=meeting,
+                    meeting_date=today,
+                    participant_name=jockey,
+                    race_number=race_num,
+                    defaults={
+                        'participant_type': tracker.meeting_type,
+                        'position': position,
+                        'points_earned': points,
+                        'is_dead_heat': is_dead_heat
+                    }
+                )
+
+    leaderboard = _build_leaderboard(participants, tracker.margin)
+
+    return {
+        'success': True,
+        'meeting': meeting,
+        'type': tracker.meeting_type,
+        'margin': tracker.margin,
+        'total_races': tracker.total_races,
+        'races_completed': tracker.races_completed,
+        'races_remaining': tracker.total_races - tracker.races_completed,
+        'leaderboard': leaderboard,
+        'race_results': tracker.get_race_results()
+    }, 200
+
+
 @csrf_exempt
 def update_race_result(request):
     """Update race result for tracker - SAVES TO DATABASE"""
@@ -854,179 +1033,57 @@ def update_race_result(request):
         results = data.get('results', [])
         actual_total_races = data.get('actual_total_races', None)
 
-        if not meeting or not race_num:
-            return JsonResponse({'success': False, 'error': 'meeting and race_num required'}, status=400)
-
-        with transaction.atomic():
-            try:
-                tracker = LiveTrackerState.objects.select_for_update().get(meeting_name=meeting)
-            except LiveTrackerState.DoesNotExist:
-                return JsonResponse({'success': False, 'error': 'Meeting not found'}, status=404)
-
-            # Update total_races if actual count provided and different
-            if actual_total_races and actual_total_races != tracker.total_races:
-                print(f"[Tracker] Updating {meeting} total_races: {tracker.total_races} -> {actual_total_races}")
-                tracker.total_races = actual_total_races
-                # Also update rides_remaining for all participants
-                participants = tracker.get_participants()
-                for name, pdata in participants.items():
-                    races_done = len(pdata.get('positions', []))
-                    pdata['rides_total'] = actual_total_races
-                    pdata['rides_remaining'] = max(0, actual_total_races - races_done)
-                tracker.set_participants(participants)
-
-            if race_num <= tracker.races_completed:
-                # Check if stored results differ (correction needed)
-                stored_results = tracker.get_race_results()
-                stored_race = None
-                for sr in stored_results:
-                    if sr.get('race') == race_num:
-                        stored_race = sr
-                        break
-
-                needs_correction = False
-                if stored_race:
-                    old_names = {r.get('jockey', r.get('name', '')).lower() for r in stored_race.get('results', [])}
-                    new_names = {r.get('jockey', r.get('name', '')).lower() for r in results}
-                    if old_names != new_names:
-                        needs_correction = True
-                        print(f"[Tracker] CORRECTION for {meeting} R{race_num}: {old_names} -> {new_names}")
-
-                if not needs_correction:
-                    return JsonResponse({'success': True, 'message': 'Race already processed'})
-
-                # Reset meeting to reprocess all races from scratch
-                print(f"[Tracker] Resetting {meeting} for correction...")
-                participants = tracker.get_participants()
-                for name, pdata in participants.items():
-                    pdata['current_points'] = 0
-                    pdata['positions'] = []
-                    pdata['points_history'] = []
-                    pdata['rides_remaining'] = tracker.total_races
-                tracker.set_participants(participants)
-                tracker.races_completed = 0
-                tracker.race_results_data = '[]'
-                tracker.save()
-
-                # Return requesting all results be re-sent
-                return JsonResponse({
-                    'success': True,
-                    'message': 'Correction detected - meeting reset',
-                    'reset': True
-                })
+        body, status = _apply_race_result(meeting, race_num, results, actual_total_races)
+        return JsonResponse(body, status=status)
+        
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return JsonResponse({'success': False, 'error': str(e)}, status=500)
 
-            participants = tracker.get_participants()
 
-            # Points system
-            points_map = {1: 3, 2: 2, 3: 1}
-
-            # Count positions for dead heat detection
-            position_counts = {}
-            for r in results:
-                pos = r.get('position', 0)
-                if pos in [1, 2, 3]:
-                    position_counts[pos] = position_counts.get(pos, 0) + 1
-
-            # Track who got points
-            participants_in_race = set()
-
-            for r in results:
-                jockey = r.get('jockey', r.get('driver', r.get('name', '')))
-                position = r.get('position', 0)
-
-                # Find matching participant (case-insensitive)
-                matched_name = None
-                for pname in participants.keys():
-                    if pname.lower() == jockey.lower() or jockey.lower() in pname.lower() or pname.lower() in jockey.lower():
-                        matched_name = pname
-                        break
-
-                if matched_name and position in [1, 2, 3]:
-                    participants_in_race.add(matched_name)
-
-                    # Calculate points with dead heat
-                    num_at_position = position_counts.get(position, 1)
-
-                    if num_at_position > 1:
-                        positions_consumed = list(range(position, min(position + num_at_position, 4)))
-                        total_points = sum(points_map.get(p, 0) for p in positions_consumed)
-                        points = round(total_points / num_at_position, 1)
-                    else:
-                        points = points_map.get(position, 0)
-
-                    participants[matched_name]['current_points'] += points
-                    participants[matched_name]['positions'].append(position)
-                    participants[matched_name]['points_history'].append(points)
-                    participants[matched_name]['rides_remaining'] -= 1
-
-            # Mark non-placed participants
-            for name, pdata in participants.items():
-                if name not in participants_in_race and pdata['rides_remaining'] > 0:
-                    pdata['rides_remaining'] -= 1
-                    pdata['positions'].append(0)
-                    pdata['points_history'].append(0)
-
-            # Recalculate AI prices
-            participants = _recalculate_ai_prices(participants, race_num, tracker.margin)
-
-            # Save race result
-            race_result = {
-                'race': race_num,
-                'results': results,
-                'dead_heats': {pos: count for pos, count in position_counts.items() if count > 1},
-                'timestamp': timezone.now().isoformat()
-            }
+@csrf_exempt
+def bulk_update_race_results(request):
+    """Apply many race results in one request, in the order given.
 
-            # Update tracker in DATABASE
-            tracker.set_participants(participants)
-            tracker.races_completed = race_num
-            tracker.add_race_result(race_result)
-            tracker.save()
+    Body: {"updates": [{"meeting", "race_num", "results", "actual_total_races"?}, ...]}.
+    Once a meeting is reset for a correction, its later updates in the batch
+    are skipped - the caller re-sends that meeting's results in full.
+    """
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'POST required'}, status=405)
 
-            # Also save to PointsLedger for history
-            today = date.today()
-            for r in results:
-                jockey = r.get('jockey', r.get('driver', r.get('name', '')))
-                position = r.get('position', 0)
-
-                if position in [1, 2, 3]:
-                    num_at_position = position_counts.get(position, 1)
-                    is_dead_heat = num_at_position > 1
-
-                    if is_dead_heat:
-                        positions_consumed = list(range(position, min(position + num_at_position, 4)))
-                        total_points = sum(points_map.get(p, 0) for p in positions_consumed)
-                        points = round(total_points / num_at_position, 1)
-                    else:
-                        points = points_map.get(position, 0)
-
-                    PointsLedger.objects.update_or_create(
-                        meeting_name=meeting,
-                        meeting_date=today,
-                        participant_name=jockey,
-                        race_number=race_num,
-                        defaults={
-                            'participant_type': tracker.meeting_type,
-                            'position': position,
-                            'points_earned': points,
-                            'is_dead_heat': is_dead_heat
-                        }
-                    )
+    try:
+        data = json.loads(request.body)
+        updates = data.get('updates', [])
+        if not isinstance(updates, list):
+            return JsonResponse({'success': False, 'error': 'updates must be a list'}, status=400)
+
+        responses = []
+        reset_meetings = set()
+        for update in updates:
+            meeting = update.get('meeting', '').upper()
+            if meeting in reset_meetings:
+                responses.append({'success': False, 'skipped': True, 'error': 'Meeting reset earlier in batch'})
+                continue
+            try:
+                body, status = _apply_race_result(
+                    meeting,
+                    update.get('race_num', 0),
+                    update.get('results', []),
+                    update.get('actual_total_races', None),
+                )
+            except Exception as e:
+                import traceback
+                traceback.print_exc()
+                body, status = {'success': False, 'error': str(e)}, 500
+            body['status'] = status
+            if body.get('reset'):
+                reset_meetings.add(meeting)
+            responses.append(body)
 
-        leaderboard = _build_leaderboard(participants, tracker.margin)
+        return JsonResponse({'success': True, 'results': responses})
 
-        return JsonResponse({
-            'success': True,
-            'meeting': meeting,
-            'type': tracker.meeting_type,
-            'margin': tracker.margin,
-            'total_races': tracker.total_races,
-            'races_completed': tracker.races_completed,
-            'races_remaining': tracker.total_races - tracker.races_completed,
-            'leaderboard': leaderboard,
-            'race_results': tracker.get_race_results()
-        })
-        
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -1108,7 +1165,8 @@ def auto_update_tracker(request):
                             result = fetch_and_update_meeting(
                                 meeting,
                                 config.get_jockeys_list(),
-                                config.last_race_fetched
+                                config.last_race_fetched,
+                                total_races=config.total_races
                             )
                             if result.get('success'):
                                 config.last_fetch_at = timezone.now()
@@ -1356,7 +1414,8 @@ def fetch_race_results_api(request, meeting_name):
             result = fetch_and_update_meeting(
                 meeting,
                 config.get_jockeys_list(),
-                config.last_race_fetched
+                config.last_race_fetched,
+                total_races=config.total_races
             )
             if result.get('success'):
                 config.last_fetch_at = timezone.now()
@@ -1636,7 +1695,8 @@ def trigger_auto_fetch(request):
                 result = fetch_and_update_meeting(
                     meeting,
                     config.get_jockeys_list(),
-                    config.last_race_fetched
+                    config.last_race_fetched,
+                    total_races=config.total_races
                 )
                 if result.get('success'):
                     config.last_fetch_at = timezone.now()
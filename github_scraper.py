@@ -9,7 +9,7 @@ import os
 import gc
 import random
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 from typing import List, Dict, Optional
 
@@ -21,6 +21,8 @@ API_URL = 'https://api.jockeydriverchallenge.com/api/receive-scrape/'
 
 MAX_RETRIES = 2
 RETRY_BACKOFF = [2, 4]
+API_BACKOFF_BASE = 2
+API_BACKOFF_CAP = 30
 MAX_MEETINGS_PER_SCRAPER = 12
 BROWSER_TIMEOUT = 30000
 NAVIGATION_TIMEOUT = 30000
@@ -41,6 +43,10 @@ USER_AGENTS = [
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:122.0) Gecko/20100101 Firefox/122.0',
 ]
 
+# Patterns used in the per-line odds parsers
+_ODDS_LINE_RE = re.compile(r'^\d+\.\d{2}$')  # "3.50"
+_LEADING_DIGIT_RE = re.compile(r'^\d')
+
 # =====================================================
 # COUNTRY DETECTION
 # =====================================================
@@ -373,13 +379,13 @@ class TABtouchScraper(BaseScraper):
                 ]
                 meeting_names = []
                 seen = set()
+                skip_words = ('any other', 'most points', 'winner',
+                              'same meeting', 'close', 'suspended')
                 for header_pattern in patterns_to_try:
                     for line in lines:
                         m = header_pattern.search(line)
                         if m:
                             name = m.group(1).strip()
-                            skip_words = ['any other', 'most points', 'winner',
-                                          'same meeting', 'close', 'suspended']
                             if (len(name) > 2 and name.upper() not in seen
                                     and not any(sw in name.lower() for sw in skip_words)):
                                 seen.add(name.upper())
@@ -1832,17 +1838,19 @@ class LadbrokesScraper(BaseScraper):
 
     def _parse_odds(self, lines):
         result = []
+        seen = set()
         skip = ['Challenge', 'keyboard', 'Same Meeting', 'Most Points', 'Winner', 'arrow']
         for i, l in enumerate(lines):
-            if re.match(r'^\d+\.\d{2}$', l):
+            if _ODDS_LINE_RE.match(l):
                 odds = float(l)
                 if i > 0 and 1.01 < odds < 500:
                     name = lines[i - 1]
                     if (name and len(name) > 3
-                            and not re.match(r'^\d', name)
+                            and not _LEADING_DIGIT_RE.match(name)
                             and not any(s.lower() in name.lower() for s in skip)
-                            and not any(p['name'] == name for p in result)):
+                            and name not in seen):
                         result.append({'name': name, 'odds': odds})
+                        seen.add(name)
         return result
 
 
@@ -2253,21 +2261,22 @@ class ElitebetScraper(BaseScraper):
     def _parse_odds(self, lines):
         """Parse odds from page lines. Same logic as LadbrokesScraper."""
         result = []
+        seen = set()
         skip = ['Challenge', 'keyboard', 'Same Meeting',
                 'Most Points', 'Winner', 'arrow', 'Racing Extras',
                 'Featured', 'Betslip', 'Next To Go']
         for i, l in enumerate(lines):
-            if re.match(r'^\d+\.\d{2}$', l):
+            if _ODDS_LINE_RE.match(l):
                 odds = float(l)
                 if i > 0 and 1.01 < odds < 500:
                     name = lines[i - 1]
                     if (name and len(name) > 3
-                            and not re.match(r'^\d', name)
+                            and not _LEADING_DIGIT_RE.match(name)
                             and not any(s.lower() in name.lower()
                                         for s in skip)
-                            and not any(p['name'] == name
-                                        for p in result)):
+                            and name not in seen):
                         result.append({'name': name, 'odds': odds})
+                        seen.add(name)
         return result
 
     def _find_meetings(self, lines):
@@ -2316,19 +2325,21 @@ class ElitebetScraper(BaseScraper):
 
     def _parse(self, lines, meeting):
         result = []
+        seen = set()
         in_m = False
         for i, l in enumerate(lines):
             if l == meeting:
                 in_m = True
                 continue
-            if in_m and re.match(r'^\d+\.\d{2}$', l):
+            if in_m and _ODDS_LINE_RE.match(l):
                 odds = float(l)
                 if i > 0:
                     name = lines[i - 1]
                     if (name and len(name) > 3
                             and 'Any Other' not in name
-                            and not any(j['name'] == name for j in result)):
+                            and name not in seen):
                         result.append({'name': name, 'odds': odds})
+                        seen.add(name)
         return result
 
 
@@ -2743,6 +2754,7 @@ class PointsBetScraper(BaseScraper):
 
         # Parse from start until next meeting or section break
         result = []
+        seen = set()
         for i in range(start + 1, min(start + 50, len(lines))):
             l = lines[i]
             # Stop at next meeting section
@@ -2750,15 +2762,16 @@ class PointsBetScraper(BaseScraper):
                     or ('Challenge' in l and l != challenge_kw
                         and meeting.lower() not in l.lower())):
                 break
-            if re.match(r'^\d+\.\d{2}$', l):
+            if _ODDS_LINE_RE.match(l):
                 odds = float(l)
                 if i > 0 and 1.01 < odds < 500:
                     name = lines[i - 1]
                     if (name and len(name) > 2
-                            and not re.match(r'^\d', name)
+                            and not _LEADING_DIGIT_RE.match(name)
                             and 'see all' not in name.lower()
-                            and not any(p['name'] == name for p in result)):
+                            and name not in seen):
                         result.append({'name': name, 'odds': odds})
+                        seen.add(name)
         return result
 
     async def scrape_jockey(self) -> List[Dict]:
@@ -2803,6 +2816,7 @@ class PointsBetScraper(BaseScraper):
 
     def _parse(self, lines, section):
         result = []
+        seen = set()
         in_s = False
         for i, l in enumerate(lines):
             if section in l:
@@ -2811,16 +2825,16 @@ class PointsBetScraper(BaseScraper):
             if in_s:
                 if 'Trainer Challenge' in l or 'Win' in l:
                     break
-                if re.match(r'^\d+\.\d{2}$', l):
+                if _ODDS_LINE_RE.match(l):
                     odds = float(l)
                     if i > 0:
                         name = lines[i - 1]
                         if (name and len(name) > 2
-                                and not re.match(r'^\d', name)
+                                and not _LEADING_DIGIT_RE.match(name)
                                 and 'see all' not in name.lower()
-                                and not any(p['name'] == name
-                                            for p in result)):
+                                and name not in seen):
                             result.append({'name': name, 'odds': odds})
+                            seen.add(name)
         return result
 
 
@@ -3915,10 +3929,11 @@ class SportsbetScraper(BaseScraper):
     def _parse(self, lines):
         """Parse odds - name appears 1-3 lines before odds value"""
         result = []
+        seen = set()
         skip = ['Challenge', 'Any Other', 'Back', 'Lay', 'Extras', 'Driver',
                 'Jockey', 'Market', 'Trainer']
         for i, l in enumerate(lines):
-            if re.match(r'^\d+\.\d{2}$', l):
+            if _ODDS_LINE_RE.match(l):
                 odds = float(l)
                 if 1.01 < odds < 500:
                     # Look back 1-3 lines for a name
@@ -3928,8 +3943,9 @@ class SportsbetScraper(BaseScraper):
                             if (name and ' ' in name and len(name) > 4
                                     and not any(c.isdigit() for c in name)
                                     and not any(s.lower() in name.lower() for s in skip)
-                                    and not any(p['name'] == name for p in result)):
+                                    and name not in seen):
                                 result.append({'name': name, 'odds': odds})
+                                seen.add(name)
                                 break
         return result
 
@@ -3976,48 +3992,59 @@ async def run_sequential(scrapers_config: List[tuple]) -> tuple:
 
 async def run_all_scrapers():
     logger.info(f"\n🏇 Starting Scraper at {datetime.now()}")
-    start = datetime.now()
+    loop = asyncio.get_running_loop()
+    start = loop.time()
 
     # Detect mode: sequential for server (LOW_RAM), parallel for GitHub Actions
     sequential = os.environ.get('SCRAPER_MODE') == 'sequential'
 
+    # One instance per site, shared by its jockey and driver runs. Each
+    # scrape call owns the instance's browser while it runs, so calls on
+    # the same instance must not overlap.
+    tabtouch = TABtouchScraper()
+    tab = TABScraper()
+    elitebet = ElitebetScraper()
+    ladbrokes = LadbrokesScraper()
+    sportsbet = SportsbetScraper()
+    pointsbet = PointsBetScraper()
+
     if sequential:
         logger.info("📌 Sequential mode (server)")
         scrapers = [
-            (TABtouchScraper().scrape, 'jockey'),
-            (TABScraper().scrape, 'jockey'),
-            (ElitebetScraper().scrape, 'jockey'),
-            (LadbrokesScraper().scrape_jockey, 'jockey'),
-            (SportsbetScraper().scrape_jockey, 'jockey'),
-            (PointsBetScraper().scrape_jockey, 'jockey'),
-            (TABtouchScraper().scrape_driver, 'driver'),
-            (TABScraper().scrape_driver, 'driver'),
-            (LadbrokesScraper().scrape_driver, 'driver'),
-            (SportsbetScraper().scrape_driver, 'driver'),
-            (PointsBetScraper().scrape_driver, 'driver'),
+            (tabtouch.scrape, 'jockey'),
+            (tab.scrape, 'jockey'),
+            (elitebet.scrape, 'jockey'),
+            (ladbrokes.scrape_jockey, 'jockey'),
+            (sportsbet.scrape_jockey, 'jockey'),
+            (pointsbet.scrape_jockey, 'jockey'),
+            (tabtouch.scrape_driver, 'driver'),
+            (tab.scrape_driver, 'driver'),
+            (ladbrokes.scrape_driver, 'driver'),
+            (sportsbet.scrape_driver, 'driver'),
+            (pointsbet.scrape_driver, 'driver'),
         ]
         jockey, driver = await run_sequential(scrapers)
     else:
         logger.info("📌 Parallel mode (GitHub Actions)")
         # Batch 1: Jockey scrapers
         batch1_results = await run_batch([
-            TABtouchScraper().scrape(),
-            LadbrokesScraper().scrape_jockey(),
-            ElitebetScraper().scrape(),
-            SportsbetScraper().scrape_jockey(),
-            TABScraper().scrape(),
+            tabtouch.scrape(),
+            ladbrokes.scrape_jockey(),
+            elitebet.scrape(),
+            sportsbet.scrape_jockey(),
+            tab.scrape(),
         ], "Batch 1")
 
         await asyncio.sleep(2)
 
         # Batch 2: Driver + PointsBet jockey
         batch2_results = await run_batch([
-            TABtouchScraper().scrape_driver(),
-            TABScraper().scrape_driver(),
-            LadbrokesScraper().scrape_driver(),
-            PointsBetScraper().scrape_jockey(),
-            PointsBetScraper().scrape_driver(),
-            SportsbetScraper().scrape_driver(),
+            tabtouch.scrape_driver(),
+            tab.scrape_driver(),
+            ladbrokes.scrape_driver(),
+            pointsbet.scrape_jockey(),
+            PointsBetScraper().scrape_driver(),  # Runs alongside pointsbet.scrape_jockey
+            sportsbet.scrape_driver(),
         ], "Batch 2")
 
         jockey, driver = [], []
@@ -4036,7 +4063,7 @@ async def run_all_scrapers():
         if len(batch2_results) > 5:
             driver.extend(batch2_results[5])  # Sportsbet driver
 
-    elapsed = int((datetime.now() - start).total_seconds())
+    elapsed = int(loop.time() - start)
     logger.info(f"✅ Done in {elapsed}s! Jockey: {len(jockey)} | Driver: {len(driver)}")
 
     # Per-scraper diagnostic summary
@@ -4059,37 +4086,70 @@ async def run_all_scrapers():
     return {
         'jockey_challenges': jockey,
         'driver_challenges': driver,
-        'last_updated': datetime.now().isoformat(),
+        'last_updated': datetime.now(timezone.utc).isoformat(),
         'total_meetings': len(jockey) + len(driver)
     }
 
 
+def _api_backoff(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Exponential backoff with jitter, honouring a numeric Retry-After."""
+    if retry_after:
+        try:
+            return min(API_BACKOFF_CAP, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    delay = min(API_BACKOFF_CAP, API_BACKOFF_BASE * 2 ** attempt)
+    return delay * (0.5 + random.random())
+
+
+def create_api_session() -> aiohttp.ClientSession:
+    """Pooled session for API posts: capped connections, cached DNS, no cookies."""
+    connector = aiohttp.TCPConnector(
+        limit=10,
+        limit_per_host=10,
+        keepalive_timeout=75,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        cookie_jar=aiohttp.DummyCookieJar(),
+        headers={'Content-Type': 'application/json', 'User-Agent': 'racing-ai/1.0'},
+    )
+
+
 async def send_to_api(data, retries: int = 3):
     logger.info(f"\n📤 Sending to API: {API_URL}")
 
-    for attempt in range(retries):
-        try:
-            async with aiohttp.ClientSession() as session:
+    async with create_api_session() as session:
+        for attempt in range(retries):
+            retry_after = None
+            try:
                 async with session.post(
                     API_URL,
                     json=data,
-                    headers={'Content-Type': 'application/json'},
                     timeout=aiohttp.ClientTimeout(total=30)
                 ) as response:
                     if response.status == 200:
                         result = await response.json()
                         logger.info(f"✅ API Response: {result}")
                         return True
-                    else:
-                        text = await response.text()
-                        logger.error(f"❌ API Error {response.status}: {text[:100]}")
-        except Exception as e:
-            logger.error(f"❌ API attempt {attempt + 1} failed: {str(e)[:60]}")
+                    text = await response.text()
+                    logger.error(f"❌ API Error {response.status}: {text[:100]}")
+                    # Client errors won't fix themselves - only retry 429 / 5xx
+                    if response.status != 429 and response.status < 500:
+                        break
+                    retry_after = response.headers.get('Retry-After')
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"❌ API attempt {attempt + 1} failed: {str(e)[:60]}")
+            except Exception as e:
+                logger.error(f"❌ API error (not retrying): {str(e)[:60]}")
+                break
 
-        if attempt < retries - 1:
-            backoff = RETRY_BACKOFF[min(attempt, len(RETRY_BACKOFF) - 1)]
-            logger.info(f"Retrying API in {backoff}s...")
-            await asyncio.sleep(backoff)
+            if attempt < retries - 1:
+                backoff = _api_backoff(attempt, retry_after)
+                logger.info(f"Retrying API in {backoff:.1f}s...")
+                await asyncio.sleep(backoff)
 
     logger.error("❌ All API attempts failed")
     return False
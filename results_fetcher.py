@@ -6,21 +6,52 @@ Fetches race results from:
 Uses simple HTTP requests - no Playwright/browser needed.
 """
 
+import functools
+import json
+import logging
+import os
 import re
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from urllib.parse import quote
+from urllib.parse import quote, unquote
+from zoneinfo import ZoneInfo
 
 # Suppress SSL warnings for HRNZ (self-signed cert)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+# VERBOSE=1 adds per-page and per-race detail
+logger.setLevel(logging.DEBUG if os.environ.get('VERBOSE') else logging.INFO)
+
 API_URL = "https://api.jockeydriverchallenge.com"
 RA_BASE = "https://www.racingaustralia.horse"
 HRNZ_BASE = "https://infohorse.hrnz.co.nz/datahrs/results"
 
+# Results already accepted by the API today, persisted between runs
+SENT_CACHE_FILE = os.environ.get('RESULTS_CACHE_FILE', '.results_cache.json')
+# Calendar pages with their ETag/Last-Modified, for conditional GETs
+CALENDAR_CACHE_FILE = os.environ.get('CALENDAR_CACHE_FILE', '.calendar_cache.json')
+
+AUS_TZ = ZoneInfo('Australia/Sydney')
+NZ_TZ = ZoneInfo('Pacific/Auckland')
+
 STATES = ["NSW", "VIC", "QLD", "SA", "WA", "TAS", "NT", "ACT"]
 
+# RA results page text when a meeting has no results yet
+NOT_AVAILABLE = 'Results for this meeting are not currently available'
+
+# Max pages fetched at once from a single site
+FETCH_WORKERS = 8
+
+# Meetings sent race by race at the same time when bulk sending is unavailable
+API_POOL = ThreadPoolExecutor(max_workers=8)
+
 # Known HRNZ club name mappings (bookmaker name -> HRNZ club name patterns)
 HRNZ_VENUE_ALIASES = {
     'wanganui': ['manawatu', 'wanganui'],
@@ -52,6 +83,42 @@ HEADERS = {
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
 }
 
+
+def create_session():
+    """Shared keep-alive session so each host's TCP/TLS setup happens once."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=2, read=0, backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    # The tracker API gets its own retry policy: a 5xx from the proxy can
+    # come back after the backend already applied an update (or reset a
+    # meeting for correction), so POSTs there are only retried when the
+    # request was never processed - connection errors and 429
+    api_adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=2, read=0, backoff_factor=0.2,
+            status_forcelist=[429],
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {'POST'},
+            raise_on_status=False,
+        ),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.mount(API_URL, api_adapter)
+    return session
+
+
+SESSION = create_session()
+
 # Sponsor prefixes to strip for matching
 SPONSOR_PREFIXES = [
     "picklebet park ", "picklebet ", "sportsbet-", "sportsbet ",
@@ -59,35 +126,89 @@ SPONSOR_PREFIXES = [
     "tabtouch park ", "tabtouch ",
 ]
 
+_SPONSOR_TUPLE = tuple(SPONSOR_PREFIXES)
+# Trailing words dropped from venue names: state codes, then track sides
+_STATE_SUFFIXES = tuple(state.lower() for state in STATES)
+_SIDE_SUFFIXES = ('scarpside', 'hillside', 'heath')
+
+# Meeting types that can follow a " - " in a venue name
+_RACE_TYPES = ('professional', 'trial', 'picnic', 'jumpout')
+
+# Words ignored when matching meeting names word by word
+_FILLER = frozenset({'park', 'the', 'and', 'of'})
+
+# Precompiled patterns used by the parsers below
+# Every ASCII byte but a-z, for stripping names down to letters
+_NON_LOWER_BYTES = bytes(c for c in range(128) if not 97 <= c <= 122)
+_NONWORD_RE = re.compile(r'[^a-z\s]')
+# Venue key in a calendar results link: bounded, and must end at the
+# href's closing quote or a query/tag boundary
+_VENUE_KEY_RE = re.compile(r'[\w%\-+ .,()]{1,120}(?=["\'&<>])')
+_VENUE_TYPE_RE = re.compile(r',(?:Professional|Picnic)$')
+# One scan of a RA results page: race anchors, JockeyLastRuns/DriverLastStarts
+# links (name in a <span> or directly in the <a>) and the exotics block
+_RESULT_TOKEN_RE = re.compile(
+    r'<a\s+name="Race(\d+)"'
+    r'|(JockeyLastRuns|DriverLastStarts)[^>]+>(?:<span[^>]*>([^<]+)</span>|\s*([^<]+?)\s*</a>)'
+    r'|id="ExoticDiv'
+)
+_HRNZ_RACE_RE = re.compile(r'Race\s+(\d+)')
+_HRNZ_ROW_RE = re.compile(
+    r'data-label="Placing"[^>]*>\s*(\d+)\s*</td>.*?data-label="Driver"[^>]*>\s*<a[^>]*>([^<]+)</a>',
+    re.DOTALL
+)
+_LINK_TEXT_RE = re.compile(r'>([^<]+)</a>')
+# HRNZ results links (MMDD##rs.htm), with and without the club name text
+_HRNZ_LINK_RE = re.compile(r'href=["\'](\d{6}rs\.htm)["\'][^>]*>([^<]+)</a>', re.IGNORECASE)
+_HRNZ_HREF_RE = re.compile(r'href=["\'](\d{6}rs\.htm)["\']', re.IGNORECASE)
+
 
 def get_australian_date():
     """Get current Australian Eastern time (handles AEST/AEDT automatically)."""
-    now_utc = datetime.now(timezone.utc)
-    # Determine if AEDT (daylight saving): first Sunday of April to first Sunday of October = AEST (UTC+10)
-    # Otherwise AEDT (UTC+11)
-    month = now_utc.month
-    if 4 <= month <= 9:
-        offset = 10  # AEST
-    else:
-        # For Oct/Nov/Dec/Jan/Feb/Mar, check exact DST transition dates
-        # Simplified: use +11 (AEDT) for Oct-Mar, +10 (AEST) for Apr-Sep
-        offset = 11  # AEDT
-    return now_utc + timedelta(hours=offset)
+    return datetime.now(AUS_TZ)
+
 
+def strip_last_word(n, words):
+    """Drop a trailing whitespace-separated word if it is one of words."""
+    if n.endswith(words):
+        for word in words:
+            head = n[:-len(word)]
+            if n.endswith(word) and head[-1:].isspace():
+                return head.rstrip()
+    return n
 
+
+def strip_race_type(n):
+    """Drop a trailing "- professional/trial/picnic/jumpout ..." part of a stripped name."""
+    dash = n.find('-')
+    while dash != -1:
+        rest = n[dash + 1:].lstrip()
+        # The type runs to the end of the name, which can't span lines
+        if rest.startswith(_RACE_TYPES) and '\n' not in rest:
+            return n[:dash].rstrip()
+        dash = n.find('-', dash + 1)
+    return n
+
+
+def letters_only(s):
+    """Keep only a-z, like re.sub(r'[^a-z]', '', s) without the regex engine."""
+    return s.encode('ascii', 'ignore').translate(None, _NON_LOWER_BYTES).decode('ascii')
+
+
+@functools.lru_cache(maxsize=512)
 def normalize_venue(name):
     """Normalize venue name for matching."""
     n = name.lower().strip()
-    for prefix in SPONSOR_PREFIXES:
-        if n.startswith(prefix):
-            n = n[len(prefix):]
-            break
-    n = re.sub(r'\s+(nsw|vic|qld|sa|wa|tas|nt|act)\s*$', '', n)
-    n = re.sub(r'\s*-\s*(professional|trial|picnic|jumpout).*$', '', n)
-    n = re.sub(r'\s+(scarpside|hillside|heath)$', '', n)
-    return re.sub(r'[^a-z]', '', n)
+    if n.startswith(_SPONSOR_TUPLE):
+        prefix = next(p for p in SPONSOR_PREFIXES if n.startswith(p))
+        n = n[len(prefix):]
+    n = strip_last_word(n, _STATE_SUFFIXES)
+    n = strip_race_type(n)
+    n = strip_last_word(n, _SIDE_SUFFIXES)
+    return letters_only(n)
 
 
+@functools.lru_cache(maxsize=512)
 def to_title_case(name):
     return ' '.join(word.capitalize() for word in name.split())
 
@@ -98,184 +219,369 @@ def build_ra_url(date_key, state, venue_key):
     return f"{RA_BASE}/FreeFields/Results.aspx?Key={date_key},{state},{encoded_venue}"
 
 
-def discover_venues_for_date(date_key):
-    """Scrape all state calendar pages to find venues for a given date key."""
-    venues = []
+# A fetched page: just what the parsers need from the response
+Page = namedtuple('Page', ['status_code', 'text'])
+
+
+def read_text(resp, sentinel):
+    """Read a streamed response body, stopping early once sentinel appears."""
+    if resp.encoding is None:
+        resp.encoding = 'utf-8'
+    parts = []
+    tail = ''
+    for chunk in resp.iter_content(8192, decode_unicode=True):
+        parts.append(chunk)
+        if sentinel in tail + chunk:
+            break
+        tail = (tail + chunk)[-len(sentinel):]
+    return ''.join(parts)
+
+
+def fetch_page(url, sentinel=None, **kwargs):
+    """GET a page. With a sentinel, download stops as soon as it is seen."""
+    if sentinel is None:
+        resp = SESSION.get(url, **kwargs)
+        return Page(resp.status_code, resp.text)
+    with SESSION.get(url, stream=True, **kwargs) as resp:
+        if resp.status_code != 200:
+            return Page(resp.status_code, '')
+        return Page(resp.status_code, read_text(resp, sentinel))
+
 
-    for state in STATES:
+def fetch_pages(urls, sentinel=None, **kwargs):
+    """GET several pages concurrently. Returns {url: Page or None}."""
+    urls = list(urls)
+    if not urls:
+        return {}
+
+    def get(url):
         try:
-            url = f"{RA_BASE}/FreeFields/Calendar_Results.aspx?State={state}"
-            resp = requests.get(url, headers=HEADERS, timeout=10)
-            if resp.status_code != 200:
-                continue
+            return fetch_page(url, sentinel, **kwargs)
+        except Exception as e:
+            logger.warning(f"  [Fetch] {url} error: {e}")
+            return None
 
-            html = resp.text
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(urls))) as pool:
+        return dict(zip(urls, pool.map(get, urls)))
+
+
+def load_calendar_cache():
+    try:
+        with open(CALENDAR_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_calendar_cache(cache):
+    try:
+        with open(CALENDAR_CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        logger.warning(f"  [Cache] Save error: {e}")
+
+
+def fetch_calendar(url, cached):
+    """Conditional GET of a calendar page. Returns (html, cache entry) or (None, None)."""
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+    try:
+        resp = SESSION.get(url, headers=headers, timeout=10)
+    except Exception as e:
+        logger.warning(f"  [Calendar] {url} error: {e}")
+        return None, None
+    if resp.status_code == 304 and cached:
+        return cached['html'], cached
+    if resp.status_code != 200:
+        return None, None
+
+    # Response.text decodes the body on every access, so read it once
+    html = resp.text
+    entry = None
+    etag = resp.headers.get('ETag')
+    last_modified = resp.headers.get('Last-Modified')
+    if etag or last_modified:
+        entry = {'etag': etag, 'last_modified': last_modified, 'html': html}
+    return html, entry
+
+
+def fetch_calendars():
+    """Fetch every state's results calendar at once. Returns {state: html}."""
+    urls = {state: f"{RA_BASE}/FreeFields/Calendar_Results.aspx?State={state}" for state in STATES}
+    cache = load_calendar_cache()
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        fetched = list(pool.map(lambda url: fetch_calendar(url, cache.get(url)), urls.values()))
+
+    calendars = {}
+    new_cache = {}
+    for (state, url), (html, entry) in zip(urls.items(), fetched):
+        if html is not None:
+            calendars[state] = html
+        if entry:
+            new_cache[url] = entry
+    save_calendar_cache(new_cache)
+    return calendars
+
+
+def calendar_venue_keys(html, date_key, state):
+    """Raw venue keys from the calendar's results links for one date and state."""
+    # Plain substring search finds each link; the regex only reads the key
+    # after it (href may use single or double quotes)
+    needle = f"Results.aspx?Key={date_key},{state},"
+    keys = []
+    pos = html.find(needle)
+    while pos != -1:
+        m = _VENUE_KEY_RE.match(html, pos + len(needle))
+        if m:
+            keys.append(m.group())
+            pos = m.end()
+        else:
+            pos += len(needle)
+        pos = html.find(needle, pos)
+    return keys
 
-            # Match href with BOTH single and double quotes
-            pattern = rf"""Results\.aspx\?Key={re.escape(date_key)},{re.escape(state)},([^"'&<>]+)"""
-            matches = re.findall(pattern, html)
+
+def discover_venues_for_date(date_key, calendars=None):
+    """Scrape all state calendar pages to find venues for a given date key."""
+    venues = []
+    if calendars is None:
+        calendars = fetch_calendars()
+
+    for state, html in calendars.items():
+        try:
+            matches = calendar_venue_keys(html, date_key, state)
 
             seen = set()
             for raw in matches:
-                venue_key = raw.replace('%20', ' ').strip()
-
-                if ',Trial' in venue_key or ',JumpOut' in venue_key:
+                # Trials and jump-outs are dropped before any decoding; the
+                # key's separators are literal commas like the prefix's
+                if ',Trial' in raw or ',JumpOut' in raw:
                     continue
 
-                venue_name = re.sub(r',(?:Professional|Picnic)$', '', venue_key)
+                venue_key = unquote(raw).strip()
+                venue_name = _VENUE_TYPE_RE.sub('', venue_key)
+                if venue_name in seen:
+                    continue
+                seen.add(venue_name)
 
-                result_url = build_ra_url(date_key, state, venue_key)
-
-                if venue_name not in seen:
-                    seen.add(venue_name)
-                    venues.append({
-                        'name': venue_name,
-                        'state': state,
-                        'url': result_url,
-                        'normalized': normalize_venue(venue_name),
-                        'date_key': date_key,
-                    })
+                venues.append({
+                    'name': venue_name,
+                    'state': state,
+                    'url': build_ra_url(date_key, state, venue_key),
+                    'normalized': normalize_venue(venue_name),
+                    'words': venue_words(venue_name),
+                    'date_key': date_key,
+                })
 
         except Exception as e:
-            print(f"  [Calendar] {state} error: {e}")
+            logger.warning(f"  [Calendar] {state} error: {e}")
 
     return venues
 
 
-def discover_todays_venues():
+def discover_todays_venues(today_key, yesterday_key):
     """Discover venues for today AND yesterday (for stale meetings)."""
-    aus_now = get_australian_date()
-    today_key = aus_now.strftime('%Y%b%d')
-    yesterday_key = (aus_now - timedelta(days=1)).strftime('%Y%b%d')
-
-    print(f"  Checking today ({today_key}) and yesterday ({yesterday_key})...")
+    logger.debug("  Checking today (%s) and yesterday (%s)...", today_key, yesterday_key)
 
-    venues = discover_venues_for_date(today_key)
-    yesterday_venues = discover_venues_for_date(yesterday_key)
+    # The calendars list every date, so one fetch serves both days
+    calendars = fetch_calendars()
+    venues = discover_venues_for_date(today_key, calendars)
+    yesterday_venues = discover_venues_for_date(yesterday_key, calendars)
 
     # Add yesterday's venues that aren't already in today's list
     today_norms = {v['normalized'] for v in venues}
     for v in yesterday_venues:
         if v['normalized'] not in today_norms:
             v['name'] = f"{v['name']} (yesterday)"
+            v['words'] = venue_words(v['name'])
             venues.append(v)
 
-    return venues, today_key
+    return venues
+
+
+def venue_words(name):
+    return frozenset(_NONWORD_RE.sub('', name.lower()).split()) - _FILLER
 
 
-def match_meeting_to_venue(meeting_name, venues):
+def index_venues(venues):
+    """Map each normalized name to its first venue, for exact matches."""
+    by_norm = {}
+    for v in venues:
+        by_norm.setdefault(v['normalized'], v)
+    return by_norm
+
+
+def match_meeting_to_venue(meeting_name, venues, by_norm=None):
     """Match API meeting name to a discovered RA venue."""
     api_norm = normalize_venue(meeting_name)
 
     # Pass 1: Exact normalized match
-    for v in venues:
-        if v['normalized'] == api_norm:
-            return v
-
-    # Pass 2: One contains the other
-    for v in venues:
-        if len(api_norm) >= 3 and len(v['normalized']) >= 3:
-            if api_norm in v['normalized'] or v['normalized'] in api_norm:
+    if by_norm is None:
+        by_norm = index_venues(venues)
+    v = by_norm.get(api_norm)
+    if v is not None:
+        return v
+
+    # Pass 2: One contains the other. Only the shorter name can sit inside
+    # the longer, and equal-length names would have matched in pass 1.
+    api_len = len(api_norm)
+    if api_len >= 3:
+        for v in venues:
+            v_norm = v['normalized']
+            v_len = len(v_norm)
+            if v_len < 3 or v_len == api_len:
+                continue
+            if (api_norm in v_norm) if v_len > api_len else (v_norm in api_norm):
                 return v
 
     # Pass 3: Word-level matching
-    api_words = set(meeting_name.lower().split()) - {'park', 'the', 'and', 'of'}
+    api_words = set(meeting_name.lower().split()) - _FILLER
     for v in venues:
-        v_words = set(re.sub(r'[^a-z\s]', '', v['name'].lower()).split()) - {'park', 'the', 'and', 'of'}
+        v_words = v['words']
         if api_words and v_words and (api_words.issubset(v_words) or v_words.issubset(api_words)):
             return v
 
     return None
 
 
-def try_direct_url(meeting_name, date_key):
-    """Fallback: try direct URL construction for unmatched meetings."""
+def probe_results_page(url):
+    """Fetch a guessed results URL. Returns (html, sections) if it has results."""
+    try:
+        resp = fetch_page(url, NOT_AVAILABLE, timeout=8)
+    except Exception:
+        return None
+    if resp.status_code != 200 or NOT_AVAILABLE in resp.text:
+        return None
+    # Parse now so the caller doesn't scan the page a second time
+    sections = parse_ra_sections(resp.text)
+    if not any(race_num == 1 for race_num, _ in sections):
+        return None
+    return resp.text, sections
+
+
+def try_direct_url(meeting_name, date_keys, hint=None):
+    """Fallback: try direct URL construction for unmatched meetings.
+
+    hint is the (date_key, state, url) that worked on an earlier run; it is
+    fetched on its own first. Otherwise every date/state guess is probed
+    at once and the first hit in date_keys then STATES order wins, without
+    waiting on the guesses after it.
+    Returns (html, url, state, sections, date_key).
+    """
+    if hint and hint[0] in date_keys:
+        hint_key, hint_state, hint_url = hint
+        found = probe_results_page(hint_url)
+        if found:
+            html, sections = found
+            return html, hint_url, hint_state, sections, hint_key
+
     venue = to_title_case(meeting_name)
+    guesses = [(date_key, state, build_ra_url(date_key, state, venue))
+               for date_key in date_keys for state in STATES]
 
-    for state in STATES:
-        url = build_ra_url(date_key, state, venue)
-        try:
-            resp = requests.get(url, headers=HEADERS, timeout=8)
-            if resp.status_code != 200:
-                continue
-            html = resp.text
-            if 'Results for this meeting are not currently available' in html:
-                continue
-            if '<a name="Race1"' not in html:
-                continue
-            return html, url, state
-        except Exception:
+    pool = ThreadPoolExecutor(max_workers=FETCH_WORKERS)
+    try:
+        futures = [pool.submit(probe_results_page, url) for _, _, url in guesses]
+        for (date_key, state, url), future in zip(guesses, futures):
+            found = future.result()
+            if found:
+                html, sections = found
+                return html, url, state, sections, date_key
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    return None, None, None, None, None
+
+
+def strip_paren_suffix(name):
+    """Trim a name and drop a trailing "(...)" marker such as "(a2)" or "(J)"."""
+    t = name.rstrip()
+    if t.endswith(')'):
+        # The marker starts at the first '(' after any earlier ')'
+        close = t.rfind(')', 0, len(t) - 1)
+        start = t.find('(', close + 1, len(t) - 1)
+        if start != -1:
+            t = t[:start]
+    return t.strip()
+
+
+def parse_ra_sections(html):
+    """Walk a RA results page once, collecting each race's names by link style.
+
+    Returns [(race_num, buckets)] with buckets of names for
+    [jockey <span>, jockey direct, driver <span>, driver direct].
+    """
+    # Actual HTML: <a ...JockeyLastRuns...><span class='Hilite'>Name</span></a>
+    sections = []
+    buckets = None
+    for m in _RESULT_TOKEN_RE.finditer(html):
+        if m.group(1):
+            buckets = ([], [], [], [])
+            sections.append((int(m.group(1)), buckets))
+        elif buckets is None:
             continue
-
-    return None, None, None
+        elif m.group(2):
+            kind = (0 if m.group(2) == 'JockeyLastRuns' else 2) + (m.group(3) is None)
+            buckets[kind].append(m.group(3) or m.group(4))
+        else:
+            # Exotics block - nothing more for this race
+            buckets = None
+    return sections
 
 
-def count_total_races(html):
-    race_nums = re.findall(r'<a\s+name="Race(\d+)"', html)
-    return max(int(n) for n in race_nums) if race_nums else 0
+def log_results(results):
+    """Log parsed race results as a single record (verbose only)."""
+    if results and logger.isEnabledFor(logging.DEBUG):
+        logger.debug('\n'.join(
+            f"  R{rd['race_num']}: " + ', '.join(f"{r['position']}. {r['jockey']}" for r in rd['results'])
+            for rd in results
+        ))
 
 
-def fetch_race_results(result_url_or_html, meeting_name, is_html=False):
-    """Parse results from RA results page."""
+def fetch_race_results(result_url_or_html, meeting_name, is_html=False, sections=None):
+    """Parse results from RA results page (sections if already parsed and checked)."""
     results = []
 
     try:
         if is_html:
             html = result_url_or_html
         else:
-            print(f"  Fetching: {result_url_or_html}")
-            resp = requests.get(result_url_or_html, headers=HEADERS, timeout=15)
-            print(f"  Status: {resp.status_code}, Length: {len(resp.text)}")
+            logger.debug("  Fetching: %s", result_url_or_html)
+            resp = fetch_page(result_url_or_html, NOT_AVAILABLE, timeout=15)
+            logger.debug("  Status: %s, Length: %d", resp.status_code, len(resp.text))
             if resp.status_code != 200:
                 return results, 0
             html = resp.text
 
-        if 'Results for this meeting are not currently available' in html:
-            print(f"  Page says: results not available")
-            return results, 0
-
-        total_races = count_total_races(html)
-        race_sections = re.split(r'<a\s+name="Race(\d+)"', html)
-        print(f"  Found {total_races} races in HTML, {len(race_sections)//2} sections")
-
-        for i in range(1, len(race_sections), 2):
-            race_num = int(race_sections[i])
-            if i + 1 >= len(race_sections):
-                break
-
-            section = race_sections[i + 1]
-            for marker in ['<a name="Race', 'id="ExoticDiv']:
-                idx = section.find(marker)
-                if idx > 0:
-                    section = section[:idx]
-
-            # Extract jockey/driver names from results
-            names = []
+        # Pages that come with their sections were checked when they were parsed
+        if sections is None:
+            if NOT_AVAILABLE in html:
+                logger.debug("  Page says: results not available")
+                return results, 0
 
-            # Pattern 1: JockeyLastRuns with name inside <span class='Hilite'>
-            # Actual HTML: <a ...JockeyLastRuns...><span class='Hilite'>Name</span></a>
-            p1 = r"JockeyLastRuns[^>]+><span[^>]*>([^<]+)</span>"
-            names = re.findall(p1, section)
+            # No jockey/driver links means no placings to read yet
+            if 'JockeyLastRuns' not in html and 'DriverLastStarts' not in html:
+                logger.debug("  No placings on page yet")
+                return results, 0
 
-            # Pattern 2: JockeyLastRuns with name directly in <a> tag (fallback)
-            if not names:
-                p2 = r'JockeyLastRuns[^>]+>\s*([^<]+?)\s*</a>'
-                names = re.findall(p2, section)
+            sections = parse_ra_sections(html)
 
-            # Pattern 3: DriverLastStarts with <span> wrapper
-            if not names:
-                p3 = r"DriverLastStarts[^>]+><span[^>]*>([^<]+)</span>"
-                names = re.findall(p3, section)
+        # Every race anchor opens a section, so the last race is in there too
+        total_races = max((race_num for race_num, _ in sections), default=0)
+        logger.debug("  Found %d races in HTML, %d sections", total_races, len(sections))
 
-            # Pattern 4: DriverLastStarts direct (fallback)
-            if not names:
-                p4 = r'DriverLastStarts[^>]+>\s*([^<]+?)\s*</a>'
-                names = re.findall(p4, section)
+        for race_num, buckets in sections:
+            # Names come from the first link style present in the race
+            names = next((b for b in buckets if b), [])
 
             race_results = []
             seen = set()
             for raw in names:
-                name = re.sub(r'\s*\([^)]*\)\s*$', '', raw).strip()
+                name = strip_paren_suffix(raw)
                 if name and name not in seen:
                     seen.add(name)
                     race_results.append({
@@ -288,13 +594,12 @@ def fetch_race_results(result_url_or_html, meeting_name, is_html=False):
 
             if race_results:
                 results.append({'race_num': race_num, 'results': race_results})
-                pos = ', '.join(f"{r['position']}. {r['jockey']}" for r in race_results)
-                print(f"  R{race_num}: {pos}")
 
     except Exception as e:
-        print(f"  Parse error: {e}")
+        logger.warning(f"  Parse error: {e}")
         return results, 0
 
+    log_results(results)
     return results, total_races
 
 
@@ -302,75 +607,75 @@ def fetch_race_results(result_url_or_html, meeting_name, is_html=False):
 # HRNZ (NZ Harness Racing) Functions
 # =====================================================
 
-def discover_hrnz_meetings():
+def discover_hrnz_meetings(nz_now=None):
     """Discover today's harness meetings from HRNZ results index."""
-    aus_now = get_australian_date()
-    # NZ is always 2 hours ahead of Australian Eastern time
-    nz_now = aus_now + timedelta(hours=2)
+    if nz_now is None:
+        nz_now = datetime.now(NZ_TZ)
     month_abbr = nz_now.strftime('%b').lower()
-    today_str = nz_now.strftime('%d %b %Y')  # e.g., "23 Feb 2026"
-    today_dd = nz_now.strftime('%d')
-    today_mm = nz_now.strftime('%m')
+    mmdd = nz_now.strftime('%m%d')
 
     meetings = []
 
     try:
         url = f"{HRNZ_BASE}/rlts_{month_abbr}.htm"
-        print(f"  Fetching HRNZ index: {url}")
-        resp = requests.get(url, headers=HEADERS, timeout=10, verify=False)
+        logger.debug("  Fetching HRNZ index: %s", url)
+        resp = SESSION.get(url, timeout=10, verify=False)
         if resp.status_code != 200:
-            print(f"  HRNZ index failed: {resp.status_code}")
+            logger.warning(f"  HRNZ index failed: {resp.status_code}")
             return meetings
 
         html = resp.text
 
         # Find meeting links for today - pattern: <a href="MMDD##rs.htm">Club Name</a>
         # The date column has format like "23 Feb 2026" or just the date
-        pattern = rf'href=["\']({today_mm}{today_dd}\d{{2}}rs\.htm)["\'][^>]*>([^<]+)</a>'
-        matches = re.findall(pattern, html, re.IGNORECASE)
+        matches = [m for m in _HRNZ_LINK_RE.findall(html) if m[0].startswith(mmdd)]
 
         if not matches:
             # Try broader: find all result links with today's MMDD prefix
-            pattern2 = rf'href=["\']({today_mm}{today_dd}\d{{2}}rs\.htm)["\']'
-            links = re.findall(pattern2, html, re.IGNORECASE)
-            # Get club names from surrounding context
-            for link in links:
-                # Find the club name near this link
-                idx = html.find(link)
-                if idx >= 0:
-                    snippet = html[idx:idx+200]
-                    name_match = re.search(r'>([^<]+)</a>', snippet)
-                    if name_match:
-                        matches.append((link, name_match.group(1)))
+            for m in _HRNZ_HREF_RE.finditer(html):
+                link = m.group(1)
+                if not link.startswith(mmdd):
+                    continue
+                # Club name is the link text just after this href
+                idx = m.start(1)
+                name_match = _LINK_TEXT_RE.search(html, idx, idx + 200)
+                if name_match:
+                    matches.append((link, name_match.group(1)))
 
         for filename, club_name in matches:
             club_name = club_name.strip()
             result_url = f"{HRNZ_BASE}/{filename}"
-            norm = re.sub(r'[^a-z]', '', club_name.lower().replace('h.r.c.', '').replace('t.c.', '').replace('r.c.', ''))
+            norm = letters_only(club_name.lower().replace('h.r.c.', '').replace('t.c.', '').replace('r.c.', ''))
             meetings.append({
                 'name': club_name,
                 'url': result_url,
                 'normalized': norm,
             })
-            print(f"  HRNZ meeting: {club_name} -> {result_url}")
+            logger.debug("  HRNZ meeting: %s -> %s", club_name, result_url)
 
     except Exception as e:
-        print(f"  HRNZ discovery error: {e}")
+        logger.warning(f"  HRNZ discovery error: {e}")
 
     return meetings
 
 
+# HRNZ_VENUE_ALIASES with each alias already in normalized form
+_HRNZ_ALIAS_NORMS = {
+    name: tuple(letters_only(alias) for alias in aliases)
+    for name, aliases in HRNZ_VENUE_ALIASES.items()
+}
+
+
 def match_driver_to_hrnz(meeting_name, hrnz_meetings):
     """Match a driver challenge meeting name to HRNZ meeting."""
     name_lower = meeting_name.lower().strip()
-    name_norm = re.sub(r'[^a-z]', '', name_lower)
+    name_norm = letters_only(name_lower)
 
     # Check aliases first
-    aliases = HRNZ_VENUE_ALIASES.get(name_lower, [name_lower])
+    alias_norms = _HRNZ_ALIAS_NORMS.get(name_lower, (name_norm,))
 
     for hm in hrnz_meetings:
-        for alias in aliases:
-            alias_norm = re.sub(r'[^a-z]', '', alias)
+        for alias_norm in alias_norms:
             if alias_norm in hm['normalized'] or hm['normalized'] in alias_norm:
                 return hm
 
@@ -382,28 +687,35 @@ def match_driver_to_hrnz(meeting_name, hrnz_meetings):
     return None
 
 
-def fetch_hrnz_results(result_url, meeting_name):
-    """Parse results from HRNZ results page."""
+def fetch_hrnz_results(result_url, meeting_name, resp=None):
+    """Parse results from HRNZ results page (fetched here unless resp is given)."""
     results = []
 
     try:
-        print(f"  Fetching: {result_url}")
-        resp = requests.get(result_url, headers=HEADERS, timeout=15, verify=False)
-        print(f"  Status: {resp.status_code}, Length: {len(resp.text)}")
+        logger.debug("  Fetching: %s", result_url)
+        if resp is None:
+            resp = fetch_page(result_url, timeout=15, verify=False)
+        logger.debug("  Status: %s, Length: %d", resp.status_code, len(resp.text))
         if resp.status_code != 200:
             return results, 0
 
         html = resp.text
 
-        # Count races - HRNZ uses <h3> tags with "Race X" or race headers
-        race_headers = re.findall(r'Race\s+(\d+)', html)
-        total_races = max(int(n) for n in race_headers) if race_headers else 0
-
-        # Split by race sections - look for "Race X" headers
-        sections = re.split(r'(?=Race\s+\d+\s)', html)
-
-        for section in sections:
-            race_match = re.match(r'Race\s+(\d+)', section)
+        # One scan for the "Race X" headers: every one counts towards the
+        # total, and those followed by whitespace start a race section
+        total_races = 0
+        bounds = [0]
+        for m in _HRNZ_RACE_RE.finditer(html):
+            total_races = max(total_races, int(m.group(1)))
+            if html[m.end():m.end() + 1].isspace():
+                bounds.append(m.start())
+        bounds.append(len(html))
+
+        # Scan each section in place with pos/endpos rather than splitting
+        # the page into copies
+
+        for start, end in zip(bounds, bounds[1:]):
+            race_match = _HRNZ_RACE_RE.match(html, start, end)
             if not race_match:
                 continue
 
@@ -411,66 +723,265 @@ def fetch_hrnz_results(result_url, meeting_name):
 
             # Extract drivers from result table rows
             # HRNZ HTML: <td data-label="Placing">1</td> ... <td data-label="Driver"><a ...>Name</a></td>
-            rows = re.findall(
-                r'data-label="Placing"[^>]*>\s*(\d+)\s*</td>.*?data-label="Driver"[^>]*>\s*<a[^>]*>([^<]+)</a>',
-                section, re.DOTALL
-            )
-
             race_results = []
-            for placing, driver in rows:
+            for row in _HRNZ_ROW_RE.finditer(html, start, end):
+                placing, driver = row.groups()
                 pos = int(placing)
                 if pos <= 3:
                     driver = driver.strip()
                     # Remove junior marker like "(J)"
-                    driver = re.sub(r'\s*\([^)]*\)\s*$', '', driver).strip()
+                    driver = strip_paren_suffix(driver)
                     if driver:
                         race_results.append({
                             'position': pos,
                             'jockey': driver,
                             'name': driver
                         })
+                        # Only the placegetters are sent, so stop matching rows
+                        if len(race_results) == 3:
+                            break
 
             if race_results:
-                results.append({'race_num': race_num, 'results': race_results[:3]})
-                pos = ', '.join(f"{r['position']}. {r['jockey']}" for r in race_results[:3])
-                print(f"  R{race_num}: {pos}")
+                results.append({'race_num': race_num, 'results': race_results})
 
     except Exception as e:
-        print(f"  HRNZ parse error: {e}")
+        logger.warning(f"  HRNZ parse error: {e}")
         return results, 0
 
+    log_results(results)
     return results, total_races
 
 
+def prefetch_hrnz(driver_meetings, nz_now=None):
+    """Find today's HRNZ meetings, match the driver meetings and fetch their pages.
+
+    Returns (hrnz_meetings, matches, pages) with matches aligned to driver_meetings.
+    """
+    hrnz_meetings = discover_hrnz_meetings(nz_now)
+    if not hrnz_meetings:
+        return hrnz_meetings, [], {}
+    matches = [match_driver_to_hrnz(m['name'], hrnz_meetings) for m in driver_meetings]
+    pages = fetch_pages({hm['url'] for hm in matches if hm}, timeout=15, verify=False)
+    return hrnz_meetings, matches, pages
+
+
+def result_key(meeting_name, race_num, results):
+    """Identify a race result by meeting, race and placed names."""
+    names = '/'.join(r['jockey'] for r in results)
+    return f"{meeting_name.upper()}|{race_num}|{names}"
+
+
+def load_sent_cache(date_key):
+    """Load today's already-sent result keys and direct-URL hits (empty on a new day).
+
+    Returns (sent, direct_hits) with direct_hits as {meeting: [date_key, state, url]}.
+    """
+    try:
+        with open(SENT_CACHE_FILE) as f:
+            data = json.load(f)
+        if data.get('date') == date_key:
+            return set(data.get('sent', [])), data.get('direct', {})
+    except (OSError, ValueError):
+        pass
+    return set(), {}
+
+
+def save_sent_cache(date_key, sent, direct_hits):
+    try:
+        with open(SENT_CACHE_FILE, 'w') as f:
+            json.dump({'date': date_key, 'sent': sorted(sent), 'direct': direct_hits}, f)
+    except OSError as e:
+        logger.warning(f"  [Cache] Save error: {e}")
+
+
+def result_payload(meeting_name, race_num, results, actual_total_races=None):
+    payload = {
+        'meeting': meeting_name.upper(),
+        'race_num': race_num,
+        'results': results
+    }
+    if actual_total_races is not None:
+        payload['actual_total_races'] = actual_total_races
+    return payload
+
+
 def send_results_to_api(meeting_name, race_num, results, actual_total_races=None):
     try:
-        payload = {
-            'meeting': meeting_name.upper(),
-            'race_num': race_num,
-            'results': results
-        }
-        if actual_total_races is not None:
-            payload['actual_total_races'] = actual_total_races
-
-        response = requests.post(
+        payload = result_payload(meeting_name, race_num, results, actual_total_races)
+
+        response = SESSION.post(
             f"{API_URL}/api/live-tracker/update/",
             json=payload, timeout=30
         )
 
         if response.status_code == 200:
-            print(f"  [API] Sent R{race_num}")
+            logger.info(f"  [API] Sent {meeting_name} R{race_num}")
             return response.json()
         else:
-            print(f"  [API] Failed R{race_num}: {response.status_code}")
+            logger.warning(f"  [API] Failed {meeting_name} R{race_num}: {response.status_code}")
             return None
     except Exception as e:
-        print(f"  [API] Error: {e}")
+        logger.warning(f"  [API] Error: {e}")
         return None
 
 
+def meeting_up_to_date(name, results, last_race, actual_total_to_send, sent):
+    """True when the tracker already has every race of the meeting as-is.
+
+    Otherwise the whole meeting is sent from R1, never just its tail: if a
+    correction reset is applied but its response is lost, the next send
+    still rebuilds the meeting in order.
+    """
+    if actual_total_to_send is not None:
+        return False
+    return all(
+        rd['race_num'] <= last_race and result_key(name, rd['race_num'], rd['results']) in sent
+        for rd in results
+    )
+
+
+def send_meeting_results(name, results, last_race, actual_total_to_send, sent):
+    """Send one meeting's results in race order. Returns the number of new results.
+
+    The backend treats any race at or below races_completed as already
+    processed, so a meeting's races must go one at a time and in order;
+    only different meetings are sent concurrently.
+    """
+    new_count = 0
+    if meeting_up_to_date(name, results, last_race, actual_total_to_send, sent):
+        return 0
+
+    # Send ALL results - backend will skip duplicates or detect corrections
+    reset_needed = False
+    for rd in results:
+        rn = rd['race_num']
+        key = result_key(name, rn, rd['results'])
+        res = send_results_to_api(name, rn, rd['results'], actual_total_to_send)
+        if res:
+            if res.get('reset'):
+                # Backend detected wrong results and reset the meeting
+                logger.info(f"  [API] {name} reset for correction - re-sending all results")
+                reset_needed = True
+                break
+            sent.add(key)
+            if rn > last_race:
+                new_count += 1
+            actual_total_to_send = None
+
+    # If reset was triggered, re-send all results to the now-clean meeting
+    if reset_needed:
+        new_count += resend_meeting_results(name, results, actual_total_to_send, sent)
+
+    return new_count
+
+
+def resend_meeting_results(name, results, actual_total_to_send, sent):
+    """Re-send every result of a meeting the backend has just reset."""
+    new_count = 0
+    for rd in results:
+        res = send_results_to_api(name, rd['race_num'], rd['results'], actual_total_to_send)
+        if res and not res.get('reset'):
+            sent.add(result_key(name, rd['race_num'], rd['results']))
+            new_count += 1
+            actual_total_to_send = None
+    return new_count
+
+
+def send_results_batch(payloads):
+    """POST many results in one request. Returns the per-result responses,
+    or None if the batch could not be delivered."""
+    try:
+        response = SESSION.post(
+            f"{API_URL}/api/live-tracker/bulk-update/",
+            json={'updates': payloads}, timeout=60
+        )
+        if response.status_code == 200:
+            return response.json().get('results', [])
+        logger.warning(f"  [API] Batch failed: {response.status_code}")
+    except Exception as e:
+        logger.warning(f"  [API] Batch error: {e}")
+    return None
+
+
+def send_all_results(pending, sent):
+    """Send every meeting's results, in one bulk request where the API has it.
+
+    pending holds (name, results, last_race, actual_total_to_send) per meeting.
+    Falls back to per-race posts if the bulk endpoint is unavailable.
+    Returns the number of new results.
+    """
+    updates = []
+    for name, results, last_race, actual_total_to_send in pending:
+        if meeting_up_to_date(name, results, last_race, actual_total_to_send, sent):
+            continue
+        for rd in results:
+            rn = rd['race_num']
+            key = result_key(name, rn, rd['results'])
+            payload = result_payload(name, rn, rd['results'], actual_total_to_send)
+            # The new race count rides on every update of the meeting, so it
+            # still lands if the first one fails; the backend stores a changed
+            # total even for races it has already processed
+            updates.append((name, last_race, key, payload))
+
+    if not updates:
+        return 0
+
+    responses = send_results_batch([u[3] for u in updates])
+    if responses is None:
+        logger.info("  [API] Sending race by race instead")
+        futures = [API_POOL.submit(send_meeting_results, *job, sent) for job in pending]
+        return sum(f.result() for f in futures)
+
+    new_count = 0
+    reset_names = set()
+    for (name, last_race, key, payload), res in zip(updates, responses):
+        rn = payload['race_num']
+        if res.get('reset'):
+            # Backend detected wrong results and reset the meeting
+            logger.info(f"  [API] {name} reset for correction - re-sending all results")
+            reset_names.add(name)
+        elif res.get('success'):
+            logger.info(f"  [API] Sent {name} R{rn}")
+            sent.add(key)
+            if rn > last_race:
+                new_count += 1
+        elif not res.get('skipped'):
+            logger.warning(f"  [API] Failed {name} R{rn}: {res.get('status')} {res.get('error', '')}")
+
+    if reset_names:
+        new_count += resend_all_results([job for job in pending if job[0] in reset_names], sent)
+
+    return new_count
+
+
+def resend_all_results(jobs, sent):
+    """Re-send every result of the meetings the backend has just reset.
+
+    jobs are pending entries; all of them go out in one bulk request, with
+    race by race as the fallback. Returns the number of results accepted.
+    """
+    updates = []
+    for name, results, last_race, actual_total_to_send in jobs:
+        for rd in results:
+            payload = result_payload(name, rd['race_num'], rd['results'], actual_total_to_send)
+            updates.append((name, rd, payload))
+
+    responses = send_results_batch([u[2] for u in updates])
+    if responses is None:
+        return sum(resend_meeting_results(name, results, actual_total_to_send, sent)
+                   for name, results, last_race, actual_total_to_send in jobs)
+
+    new_count = 0
+    for (name, rd, payload), res in zip(updates, responses):
+        if res.get('success') and not res.get('reset'):
+            sent.add(result_key(name, rd['race_num'], rd['results']))
+            new_count += 1
+    return new_count
+
+
 def get_active_meetings():
     try:
-        response = requests.get(f"{API_URL}/api/live-tracker/", timeout=60)
+        response = SESSION.get(f"{API_URL}/api/live-tracker/", timeout=60)
         if response.status_code == 200:
             data = response.json()
             trackers = data.get('trackers', {})
@@ -485,182 +996,166 @@ def get_active_meetings():
                     })
             return meetings
     except Exception as e:
-        print(f"[API] Error: {e}")
+        logger.warning(f"[API] Error: {e}")
     return []
 
 
 def main():
     aus_now = get_australian_date()
 
-    print(f"\n{'='*60}")
-    print(f"Results Fetcher")
-    print(f"UTC:  {datetime.now(timezone.utc).isoformat()}")
-    print(f"AEDT: {aus_now.isoformat()}")
-    print(f"{'='*60}")
+    logger.info(f"\n{'='*60}")
+    logger.info(f"Results Fetcher")
+    logger.info(f"UTC:  {aus_now.astimezone(timezone.utc).isoformat()}")
+    logger.info(f"AEDT: {aus_now.isoformat()}")
+    logger.info(f"{'='*60}")
 
     meetings = get_active_meetings()
     if not meetings:
-        print("No active meetings")
+        logger.info("No active meetings")
         return
 
     jockey_meetings = [m for m in meetings if m['type'] == 'jockey']
     driver_meetings = [m for m in meetings if m['type'] == 'driver']
 
-    print(f"\nActive: {len(jockey_meetings)} jockey, {len(driver_meetings)} driver")
+    logger.info(f"\nActive: {len(jockey_meetings)} jockey, {len(driver_meetings)} driver")
     for m in meetings:
-        print(f"  - {m['name']} [{m['type']}] ({m['races_completed']}/{m['total_races']})")
+        logger.debug("  - %s [%s] (%s/%s)", m['name'], m['type'], m['races_completed'], m['total_races'])
 
     if not jockey_meetings and not driver_meetings:
-        print("No meetings to process")
+        logger.info("No meetings to process")
         return
 
-    total_sent = 0
+    pending = []
+    # One clock read for the whole run, so every lookup agrees on the date
+    date_key = aus_now.strftime('%Y%b%d')
+    yesterday_key = (aus_now - timedelta(days=1)).strftime('%Y%b%d')
+    sent, direct_hits = load_sent_cache(date_key)
+    venue_matches = []
+
+    # HRNZ is a separate host, so its lookups run while RA is processed
+    if driver_meetings:
+        hrnz_pool = ThreadPoolExecutor(max_workers=1)
+        hrnz_future = hrnz_pool.submit(prefetch_hrnz, driver_meetings, aus_now.astimezone(NZ_TZ))
+        hrnz_pool.shutdown(wait=False)
 
     # =========================================================
     # THOROUGHBRED / JOCKEY MEETINGS (Racing Australia)
     # =========================================================
     if jockey_meetings:
-        print(f"\nDiscovering today's venues from Racing Australia...")
-        venues, date_key = discover_todays_venues()
-        print(f"Found {len(venues)} venues:")
+        logger.info(f"\nDiscovering today's venues from Racing Australia...")
+        venues = discover_todays_venues(date_key, yesterday_key)
+        logger.info(f"Found {len(venues)} venues:")
         for v in venues:
-            print(f"  - {v['name']} ({v['state']}) [norm: {v['normalized']}]")
+            logger.debug("  - %s (%s) [norm: %s]", v['name'], v['state'], v['normalized'])
+
+        logger.info(f"\n{'='*60}")
+        logger.info("Matching & fetching jockey results...")
+        logger.info(f"{'='*60}")
 
-        print(f"\n{'='*60}")
-        print("Matching & fetching jockey results...")
-        print(f"{'='*60}")
+        # Match against the calendar up front and fetch every matched
+        # results page at once
+        venue_index = index_venues(venues)
+        venue_matches = [match_meeting_to_venue(m['name'], venues, venue_index) for m in jockey_meetings]
+        result_pages = fetch_pages({v['url'] for v in venue_matches if v}, NOT_AVAILABLE, timeout=15)
 
-    for meeting in jockey_meetings:
+    for meeting, matched in zip(jockey_meetings, venue_matches):
         name = meeting['name']
         last_race = meeting['races_completed']
         tracker_total = meeting['total_races']
 
-        print(f"\n--- {name} ({last_race}/{tracker_total}) ---")
-
-        # Try calendar match first
-        matched = match_meeting_to_venue(name, venues)
+        logger.info(f"\n--- {name} ({last_race}/{tracker_total}) ---")
 
         html = None
         result_url = None
+        sections = None
 
         if matched:
-            print(f"  Matched: {matched['name']} ({matched['state']})")
+            logger.info(f"  Matched: {matched['name']} ({matched['state']})")
             result_url = matched['url']
+            logger.debug("  Fetching: %s", result_url)
+            resp = result_pages.get(result_url)
+            if resp is None:
+                continue
+            logger.debug("  Status: %s, Length: %d", resp.status_code, len(resp.text))
+            if resp.status_code != 200:
+                continue
+            html = resp.text
         else:
             # Fallback: try direct URL with base name across all states
-            print(f"  No calendar match (norm: '{normalize_venue(name)}'), trying direct URL...")
-            html, result_url, state = try_direct_url(name, date_key)
+            logger.info(f"  No calendar match (norm: '{normalize_venue(name)}'), trying direct URL...")
+            # Today first, then yesterday; last run's hit before either
+            html, result_url, state, sections, found_key = try_direct_url(
+                name, (date_key, yesterday_key), direct_hits.get(name))
             if html:
-                print(f"  Found via direct URL ({state})")
+                direct_hits[name] = [found_key, state, result_url]
+            if found_key == date_key:
+                logger.info(f"  Found via direct URL ({state})")
+            elif html:
+                logger.info(f"  Found via direct URL yesterday ({state})")
             else:
-                # Try yesterday
-                yesterday_key = (aus_now - timedelta(days=1)).strftime('%Y%b%d')
-                html, result_url, state = try_direct_url(name, yesterday_key)
-                if html:
-                    print(f"  Found via direct URL yesterday ({state})")
-                else:
-                    print(f"  Not found on RA")
-                    continue
+                logger.info(f"  Not found on RA")
+                continue
 
-        # Fetch and parse results
-        if html:
-            results, actual_total = fetch_race_results(html, name, is_html=True)
-        else:
-            results, actual_total = fetch_race_results(result_url, name)
+        results, actual_total = fetch_race_results(html, name, is_html=True, sections=sections)
 
         if not results:
-            print(f"  No results yet")
+            logger.info(f"  No results yet")
             continue
 
         # Check total races mismatch
         actual_total_to_send = None
         if actual_total > 0 and actual_total != tracker_total:
-            print(f"  Races: tracker={tracker_total}, actual={actual_total}")
+            logger.info(f"  Races: tracker={tracker_total}, actual={actual_total}")
             actual_total_to_send = actual_total
 
-        # Send ALL results - backend will skip duplicates or detect corrections
-        reset_needed = False
-        for rd in results:
-            rn = rd['race_num']
-            res = send_results_to_api(name, rn, rd['results'], actual_total_to_send)
-            if res:
-                if res.get('reset'):
-                    # Backend detected wrong results and reset the meeting
-                    print(f"  Meeting reset for correction - re-sending all results")
-                    reset_needed = True
-                    break
-                if rn > last_race:
-                    total_sent += 1
-                actual_total_to_send = None
-
-        # If reset was triggered, re-send all results to the now-clean meeting
-        if reset_needed:
-            for rd in results:
-                res = send_results_to_api(name, rd['race_num'], rd['results'], actual_total_to_send)
-                if res and not res.get('reset'):
-                    total_sent += 1
-                    actual_total_to_send = None
+        pending.append((name, results, last_race, actual_total_to_send))
 
     # =========================================================
     # HARNESS / DRIVER MEETINGS (HRNZ - New Zealand)
     # =========================================================
     if driver_meetings:
-        print(f"\n{'='*60}")
-        print(f"Processing {len(driver_meetings)} driver meetings (HRNZ)...")
-        print(f"{'='*60}")
+        logger.info(f"\n{'='*60}")
+        logger.info(f"Processing {len(driver_meetings)} driver meetings (HRNZ)...")
+        logger.info(f"{'='*60}")
 
-        hrnz_meetings = discover_hrnz_meetings()
+        hrnz_meetings, hrnz_matches, hrnz_pages = hrnz_future.result()
         if not hrnz_meetings:
-            print("  No HRNZ meetings found for today")
+            logger.info("  No HRNZ meetings found for today")
         else:
-            for meeting in driver_meetings:
+            for meeting, matched in zip(driver_meetings, hrnz_matches):
                 name = meeting['name']
                 last_race = meeting['races_completed']
                 tracker_total = meeting['total_races']
 
-                print(f"\n--- {name} ({last_race}/{tracker_total}) [driver] ---")
+                logger.info(f"\n--- {name} ({last_race}/{tracker_total}) [driver] ---")
 
-                matched = match_driver_to_hrnz(name, hrnz_meetings)
                 if not matched:
-                    print(f"  Not found on HRNZ")
+                    logger.info(f"  Not found on HRNZ")
                     continue
 
-                print(f"  Matched: {matched['name']}")
-                results, actual_total = fetch_hrnz_results(matched['url'], name)
+                logger.info(f"  Matched: {matched['name']}")
+                resp = hrnz_pages.get(matched['url'])
+                if resp is None:
+                    continue
+                results, actual_total = fetch_hrnz_results(matched['url'], name, resp)
 
                 if not results:
-                    print(f"  No results yet")
+                    logger.info(f"  No results yet")
                     continue
 
                 actual_total_to_send = None
                 if actual_total > 0 and actual_total != tracker_total:
-                    print(f"  Races: tracker={tracker_total}, actual={actual_total}")
+                    logger.info(f"  Races: tracker={tracker_total}, actual={actual_total}")
                     actual_total_to_send = actual_total
 
-                # Send ALL results - backend handles duplicates/corrections
-                reset_needed = False
-                for rd in results:
-                    rn = rd['race_num']
-                    res = send_results_to_api(name, rn, rd['results'], actual_total_to_send)
-                    if res:
-                        if res.get('reset'):
-                            print(f"  Meeting reset for correction - re-sending all results")
-                            reset_needed = True
-                            break
-                        if rn > last_race:
-                            total_sent += 1
-                        actual_total_to_send = None
-
-                if reset_needed:
-                    for rd in results:
-                        res = send_results_to_api(name, rd['race_num'], rd['results'], actual_total_to_send)
-                        if res and not res.get('reset'):
-                            total_sent += 1
-                            actual_total_to_send = None
-
-    print(f"\n{'='*60}")
-    print(f"Done! Sent {total_sent} new results")
-    print(f"{'='*60}")
+                pending.append((name, results, last_race, actual_total_to_send))
+
+    total_sent = send_all_results(pending, sent)
+    save_sent_cache(date_key, sent, direct_hits)
+
+    logger.info(f"\n{'='*60}")
+    logger.info(f"Done! Sent {total_sent} new results")
+    logger.info(f"{'='*60}")
 
 
 if __name__ == "__main__":